@@ -14,6 +14,7 @@ Business value:
 from __future__ import annotations
 
 import logging
+from operator import attrgetter
 from typing import List, Optional, Tuple
 
 from pii_detector.domain.entity.pii_entity import PIIEntity
@@ -153,6 +154,15 @@ class CompositePIIDetector:
             # Presidio models are loaded on first use
             pass
     
+    def close(self) -> None:
+        """Release the thread pools and models held by the ML detector."""
+        close = getattr(self.ml_detector, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception as e:
+                self.logger.warning(f"ML detector close failed: {e}")
+    
     def detect_pii(
         self, 
         text: str, 
@@ -360,7 +370,7 @@ class CompositePIIDetector:
             return text
 
         # Sort by start position for linear scan
-        sorted_entities = sorted(entities, key=lambda x: x.start)
+        sorted_entities = sorted(entities, key=attrgetter('start'))
         
         parts = []
         last_pos = 0
@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from typing import Iterable, List, Optional, Tuple
 
 from pii_detector.application.config.detection_policy import DetectionConfig
@@ -151,6 +152,17 @@ class MultiModelPIIDetector:
             except Exception as e:
                 self.logger.warning(f"Load failed for {det.model_id}: {e}")
 
+    def close(self) -> None:
+        """Release the thread pools and models held by each detector."""
+        for det in self.detectors:
+            close = getattr(det, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                self.logger.warning(f"Close failed for {det.model_id}: {e}")
+
     # Inference operations -------------------------------------------------
     def detect_pii(self, text: str, threshold: Optional[float] = None) -> List[PIIEntity]:
         """Run detection in parallel across models and merge results without duplicates.
@@ -251,13 +263,17 @@ class MultiModelPIIDetector:
 
     def mask_pii(self, text: str, threshold: Optional[float] = None) -> Tuple[str, List[PIIEntity]]:
         entities = self.detect_pii(text, threshold)
-        # Apply masking in descending order of start index to preserve spans
-        entities_sorted = sorted(entities, key=lambda x: x.start, reverse=True)
-        masked_text = text
-        for entity in entities_sorted:
-            mask = f"[{entity.pii_type}]"
-            masked_text = masked_text[: entity.start] + mask + masked_text[entity.end :]
-        return masked_text, entities
+        # Build the masked text in one linear scan over entities sorted by start
+        parts = []
+        last_pos = 0
+        for entity in sorted(entities, key=attrgetter('start')):
+            if entity.start < last_pos:
+                continue  # overlaps an already masked entity
+            parts.append(text[last_pos : entity.start])
+            parts.append(f"[{entity.pii_type}]")
+            last_pos = entity.end
+        parts.append(text[last_pos:])
+        return "".join(parts), entities
 
     @property
     def model_id(self) -> str:
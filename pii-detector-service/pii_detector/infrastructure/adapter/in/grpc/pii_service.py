@@ -155,6 +155,29 @@ def _initialize_detector_instance():
         logger.info("No ML detector initialized - will use rule-based detection only")
 
 
+def _shutdown_detector_instance():
+    """
+    Release the singleton detector's thread pools and models.
+
+    Idempotent, like _shutdown_pii_log_listener(): called from
+    MemoryLimitedServer.stop() and registered as an exit hook for servers
+    stopped through the raw gRPC handle.
+    """
+    global _detector_instance
+    with _detector_lock:
+        detector, _detector_instance = _detector_instance, None
+    close = getattr(detector, "close", None)
+    if close is not None:
+        try:
+            close()
+            logger.debug("PII detector closed successfully")
+        except Exception as e:
+            logger.warning(f"Error closing PII detector: {e}")
+
+
+atexit.register(_shutdown_detector_instance)
+
+
 def _pre_cache_models() -> None:
     """Pre-cache additional HuggingFace models if available."""
     try:
@@ -1491,6 +1514,9 @@ class MemoryLimitedServer:
             self.executor.shutdown(wait=True)
             logger.info("Thread pool executor shut down")
         
+        # Release detector thread pools and models once no request can use them
+        _shutdown_detector_instance()
+        
         # Flush remaining PII logs before final shutdown
         _shutdown_pii_log_listener()
     
@@ -21,8 +21,9 @@ CONSOLIDATED VERSION: 44 PII types across 7 categories
 
 import logging
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import AbstractSet, Dict, List, Mapping, Optional, Tuple, Union
 
 from pii_detector.domain.entity.detector_source import DetectorSource
 from pii_detector.domain.entity.pii_entity import PIIEntity
@@ -34,6 +35,39 @@ logger = logging.getLogger(__name__)
 # Conflict Group Definition
 # =============================================================================
 
+def _casefold_pattern(pattern: str) -> str:
+    """
+    Lowercase the ASCII letters of a regex, leaving escape sequences intact.
+
+    Patterns are matched case-insensitively. Rather than paying for
+    re.IGNORECASE on every character, the pattern is folded once here and
+    matched against input folded with _fold_text().
+    """
+    folded = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            folded.append(char)
+            escaped = False
+        elif char == "\\":
+            folded.append(char)
+            escaped = True
+        else:
+            folded.append(char.lower() if char.isascii() else char)
+    return "".join(folded)
+
+
+# Characters re.IGNORECASE treats as ASCII letters but str.lower() does not
+# map onto them: dotless i, dotted capital I (which lower() turns into two
+# characters) and long s. The Kelvin sign already lowers to "k".
+_FOLD_TABLE = str.maketrans({"\u0131": "i", "\u0130": "i", "\u017f": "s"})
+
+
+def _fold_text(text: str) -> str:
+    """Lowercase text so folded patterns match it as re.IGNORECASE would."""
+    return text.translate(_FOLD_TABLE).lower()
+
+
 @dataclass
 class ConflictGroup:
     """
@@ -44,11 +78,34 @@ class ConflictGroup:
         group_pattern: Regex to identify if text belongs to this group
         type_patterns: Dict mapping PII type to its specific validation regex
         fallback_priority: Ordered list for when patterns don't resolve conflict
+        required_literal: Substring every group_pattern match must contain;
+                          checked before the regex to skip hopeless groups
+
+    Compiled patterns and the fallback rank are derived once in
+    __post_init__ and read directly off the group by the resolver.
     """
     name: str
     group_pattern: str
     type_patterns: Dict[str, str]  # pii_type -> specific regex pattern
     fallback_priority: List[str]
+    required_literal: Optional[str] = None
+    compiled_group_pattern: re.Pattern = field(init=False, repr=False, compare=False)
+    compiled_type_patterns: Dict[str, re.Pattern] = field(init=False, repr=False, compare=False)
+    fallback_rank: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Patterns stay on the stdlib `re` engine: they are short, anchored and
+        # run against spans of a few dozen characters, so per-call overhead
+        # dominates and third-party regex engines would gain nothing.
+        self.compiled_group_pattern = re.compile(_casefold_pattern(self.group_pattern))
+        self.compiled_type_patterns = {
+            pii_type: re.compile(_casefold_pattern(pattern))
+            for pii_type, pattern in self.type_patterns.items()
+        }
+        # Rank of each type within the fallback priority (lower wins)
+        self.fallback_rank = {
+            pii_type: i for i, pii_type in enumerate(self.fallback_priority)
+        }
 
 
 # =============================================================================
@@ -72,7 +129,8 @@ CONFLICT_GROUPS: List[ConflictGroup] = [
             # Medical record: generic dotted number
             "MEDICAL_RECORD_NUMBER": r"^\d{1,3}(\.\d{1,4}){2,}$",
         },
-        fallback_priority=["IP_ADDRESS", "AVS_NUMBER", "MEDICAL_RECORD_NUMBER"]
+        fallback_priority=["IP_ADDRESS", "AVS_NUMBER", "MEDICAL_RECORD_NUMBER"],
+        required_literal="."
     ),
 
     # -------------------------------------------------------------------------
@@ -92,7 +150,8 @@ CONFLICT_GROUPS: List[ConflictGroup] = [
             # Bank account: longer sequences
             "BANK_ACCOUNT_NUMBER": r"^\d{4}(-\d{4}){2,4}$",
         },
-        fallback_priority=["SSN", "NATIONAL_ID", "PHONE_NUMBER", "BANK_ACCOUNT_NUMBER"]
+        fallback_priority=["SSN", "NATIONAL_ID", "PHONE_NUMBER", "BANK_ACCOUNT_NUMBER"],
+        required_literal="-"
     ),
 
     # -------------------------------------------------------------------------
@@ -148,7 +207,8 @@ CONFLICT_GROUPS: List[ConflictGroup] = [
             # Username with @ (like Twitter handles)
             "USERNAME": r"^@?[a-zA-Z][a-zA-Z0-9_]{2,30}$",
         },
-        fallback_priority=["EMAIL", "USERNAME"]
+        fallback_priority=["EMAIL", "USERNAME"],
+        required_literal="@"
     ),
 
     # -------------------------------------------------------------------------
@@ -165,7 +225,8 @@ CONFLICT_GROUPS: List[ConflictGroup] = [
             # Hostname in URL
             "HOSTNAME": r"^https?://[a-zA-Z][a-zA-Z0-9-]*(\.[a-zA-Z0-9-]+)*",
         },
-        fallback_priority=["URL", "IP_ADDRESS", "HOSTNAME"]
+        fallback_priority=["URL", "IP_ADDRESS", "HOSTNAME"],
+        required_literal="://"
     ),
 
     # -------------------------------------------------------------------------
@@ -287,7 +348,8 @@ CONFLICT_GROUPS: List[ConflictGroup] = [
             # Medical record number
             "MEDICAL_RECORD_NUMBER": r"^(MRN|MR)?\d{6,12}$",
         },
-        fallback_priority=["AVS_NUMBER", "HEALTH_INSURANCE_NUMBER", "MEDICAL_RECORD_NUMBER"]
+        fallback_priority=["AVS_NUMBER", "HEALTH_INSURANCE_NUMBER", "MEDICAL_RECORD_NUMBER"],
+        required_literal="."
     ),
 ]
 
@@ -308,6 +370,19 @@ CATEGORY_PRIORITY: Dict[str, int] = {
 }
 
 
+def _score_of(detected_labels: List[Tuple[str, float]], pii_type: str) -> float:
+    """
+    Return the score of the first label matching pii_type.
+
+    A linear scan is cheaper than building a lookup dict for the handful
+    of labels a conflicting span typically carries.
+    """
+    for label, score in detected_labels:
+        if label == pii_type:
+            return score
+    return 0.0
+
+
 # =============================================================================
 # Conflict Resolver Class
 # =============================================================================
@@ -337,21 +412,18 @@ class ConflictResolver:
             pii_type_to_category: Mapping from PII type to its category.
                                   Loaded from database if not provided.
         """
-        self.pii_type_to_category = pii_type_to_category or {}
+        # Read-only copy so _type_priority below can never go stale;
+        # build a new resolver to change the mapping
+        self.pii_type_to_category: Mapping[str, str] = MappingProxyType(
+            dict(pii_type_to_category or {})
+        )
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
-        # Pre-compile all patterns for efficiency
-        self._compiled_group_patterns: Dict[str, re.Pattern] = {}
-        self._compiled_type_patterns: Dict[str, Dict[str, re.Pattern]] = {}
-
-        for group in CONFLICT_GROUPS:
-            self._compiled_group_patterns[group.name] = re.compile(
-                group.group_pattern, re.IGNORECASE
-            )
-            self._compiled_type_patterns[group.name] = {
-                pii_type: re.compile(pattern, re.IGNORECASE)
-                for pii_type, pattern in group.type_patterns.items()
-            }
+        # Category priority resolved per type up front (one lookup per label later)
+        self._type_priority: Dict[str, int] = {
+            pii_type: CATEGORY_PRIORITY.get(category, 0)
+            for pii_type, category in self.pii_type_to_category.items()
+        }
 
         # Conflict statistics for monitoring
         self._conflict_stats: Dict[str, int] = {
@@ -362,7 +434,7 @@ class ConflictResolver:
         }
 
         self.logger.info(
-            f"ConflictResolver initialized with {len(CONFLICT_GROUPS)} conflict groups"
+            "ConflictResolver initialized with %d conflict groups", len(CONFLICT_GROUPS)
         )
 
     def _log_conflict_resolution(
@@ -387,23 +459,23 @@ class ConflictResolver:
             resolution_method: How the conflict was resolved
             group_name: Name of conflict group if applicable
         """
-        text_preview = text[:40] + "..." if len(text) > 40 else text
-
-        # Build labels summary with scores
-        labels_summary = ", ".join(
-            f"{t}({s:.2f})" for t, s in sorted(detected_labels, key=lambda x: -x[1])
-        )
+        # Only build the preview and candidate summary when INFO is emitted;
+        # stats below must be updated regardless of the log level.
+        if self.logger.isEnabledFor(logging.INFO):
+            text_preview = text[:40] + "..." if len(text) > 40 else text
+
+            # Build labels summary with scores
+            labels_summary = ", ".join(
+                f"{t}({s:.2f})" for t, s in sorted(detected_labels, key=lambda x: -x[1])
+            )
 
-        # Log the resolution
-        self.logger.info(
-            f"[{detection_id}] CONFLICT RESOLVED | "
-            f"text='{text_preview}' | "
-            f"candidates=[{labels_summary}] | "
-            f"winner={winner} | "
-            f"discarded=[{', '.join(losers)}] | "
-            f"method={resolution_method}" +
-            (f" | group={group_name}" if group_name else "")
-        )
+            self.logger.info(
+                "[%s] CONFLICT RESOLVED | text='%s' | candidates=[%s] | "
+                "winner=%s | discarded=[%s] | method=%s%s",
+                detection_id, text_preview, labels_summary,
+                winner, ", ".join(losers), resolution_method,
+                f" | group={group_name}" if group_name else ""
+            )
 
         # Update stats
         self._conflict_stats["total_conflicts"] += 1
@@ -427,7 +499,8 @@ class ConflictResolver:
         self,
         text: str,
         detected_labels: List[Tuple[str, float]],
-        detection_id: str = ""
+        detection_id: str = "",
+        detected_types: Optional[AbstractSet[str]] = None
     ) -> Optional[Tuple[str, float]]:
         """
         Resolve conflict for a span with multiple detected labels.
@@ -436,6 +509,8 @@ class ConflictResolver:
             text: The text content of the span
             detected_labels: List of (pii_type, score) tuples
             detection_id: Logging ID for traceability
+            detected_types: Distinct types in detected_labels, if the caller
+                            already tracks them (avoids rebuilding the set)
 
         Returns:
             Tuple of (winning_pii_type, score) or None if no resolution
@@ -446,56 +521,71 @@ class ConflictResolver:
         if len(detected_labels) == 1:
             return detected_labels[0]
 
-        detected_types = {label for label, _ in detected_labels}
-        scores = {label: score for label, score in detected_labels}
+        if detected_types is None:
+            detected_types = {label for label, _ in detected_labels}
+        # Patterns are case-folded at import; match against folded text
+        text_lc = _fold_text(text)
 
         # Try pattern-based resolution
         for group in CONFLICT_GROUPS:
-            group_pattern = self._compiled_group_patterns[group.name]
+            # Cheap substring prefilter before running the group regex
+            if group.required_literal is not None and group.required_literal not in text:
+                continue
 
-            # Check if text matches this group's pattern
-            if not group_pattern.match(text):
+            # Check if any detected types belong to this group; this is far
+            # cheaper than the group regex and rules out most groups, so it
+            # runs first (group order itself is precedence and stays fixed)
+            type_patterns = group.compiled_type_patterns
+            if detected_types.isdisjoint(type_patterns):
                 continue
 
-            # Check if any detected types belong to this group
-            relevant_types = detected_types & set(group.type_patterns.keys())
-            if not relevant_types:
+            # Check if text matches this group's pattern
+            if not group.compiled_group_pattern.match(text_lc):
                 continue
 
+            relevant_types = detected_types.intersection(type_patterns)
+
             self.logger.debug(
-                f"[{detection_id}] Matched conflict group: {group.name}"
+                "[%s] Matched conflict group: %s", detection_id, group.name
             )
 
-            # Test each type-specific pattern
-            matching_types = []
+            # Test each type-specific pattern; a second match makes the
+            # group ambiguous, so stop testing there
+            winner = None
+            match_count = 0
             for pii_type in relevant_types:
-                if pii_type in self._compiled_type_patterns[group.name]:
-                    type_pattern = self._compiled_type_patterns[group.name][pii_type]
-                    if type_pattern.match(text):
-                        matching_types.append(pii_type)
-                        self.logger.debug(
-                            f"[{detection_id}] Type pattern matched: {pii_type}"
-                        )
+                if type_patterns[pii_type].match(text_lc):
+                    self.logger.debug(
+                        "[%s] Type pattern matched: %s", detection_id, pii_type
+                    )
+                    match_count += 1
+                    if match_count > 1:
+                        break
+                    winner = pii_type
 
             # Exactly one match -> winner
-            if len(matching_types) == 1:
-                winner = matching_types[0]
+            if match_count == 1:
                 losers = [t for t in detected_types if t != winner]
                 self._log_conflict_resolution(
                     detection_id, text, detected_labels,
                     winner, losers, "pattern_match", group.name
                 )
-                return (winner, scores.get(winner, 0.0))
+                return (winner, _score_of(detected_labels, winner))
 
             # Multiple or no matches -> use fallback priority
-            for pii_type in group.fallback_priority:
-                if pii_type in detected_types:
-                    losers = [t for t in detected_types if t != pii_type]
-                    self._log_conflict_resolution(
-                        detection_id, text, detected_labels,
-                        pii_type, losers, "fallback_priority", group.name
-                    )
-                    return (pii_type, scores.get(pii_type, 0.0))
+            fallback_rank = group.fallback_rank
+            candidates = [
+                (fallback_rank[pii_type], pii_type)
+                for pii_type in detected_types if pii_type in fallback_rank
+            ]
+            if candidates:
+                pii_type = min(candidates)[1]
+                losers = [t for t in detected_types if t != pii_type]
+                self._log_conflict_resolution(
+                    detection_id, text, detected_labels,
+                    pii_type, losers, "fallback_priority", group.name
+                )
+                return (pii_type, _score_of(detected_labels, pii_type))
 
         # No conflict group matched -> use category priority
         return self._resolve_by_category_priority(text, detected_labels, detection_id)
@@ -519,18 +609,20 @@ class ConflictResolver:
         Returns:
             Tuple of (winning_pii_type, score)
         """
-        # Score each type by category priority
-        type_priorities = []
-        for pii_type, score in detected_labels:
-            category = self.pii_type_to_category.get(pii_type, "")
-            priority = CATEGORY_PRIORITY.get(category, 0)
-            type_priorities.append((pii_type, priority, score, category))
-
-        # Sort by priority (desc), then by score (desc)
-        type_priorities.sort(key=lambda x: (x[1], x[2]), reverse=True)
-
-        winner_type, winner_priority, winner_score, winner_category = type_priorities[0]
-        losers = [t for t, _, _, _ in type_priorities[1:]]
+        # Score each type by category priority as flat (priority, score, index)
+        type_priority = self._type_priority
+        type_priorities = [
+            (type_priority.get(pii_type, 0), score, i)
+            for i, (pii_type, score) in enumerate(detected_labels)
+        ]
+
+        # Highest priority wins, then highest score; first occurrence on ties
+        winner_priority, winner_score, winner_index = max(
+            type_priorities, key=lambda x: (x[0], x[1])
+        )
+        winner_type = detected_labels[winner_index][0]
+        others = [entry for entry in type_priorities if entry[2] != winner_index]
+        losers = [detected_labels[i][0] for _, _, i in others]
 
         self._log_conflict_resolution(
             detection_id, text, detected_labels,
@@ -538,11 +630,15 @@ class ConflictResolver:
         )
 
         # Also log the category reasoning
-        self.logger.debug(
-            f"[{detection_id}] Category priority details: "
-            f"{winner_type} ({winner_category}={winner_priority}) beat "
-            f"{[(t, c, p) for t, p, _, c in type_priorities[1:]]}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "[%s] Category priority details: %s (%s=%d) beat %s",
+                detection_id, winner_type,
+                self.pii_type_to_category.get(winner_type, ""), winner_priority,
+                [(detected_labels[i][0],
+                  self.pii_type_to_category.get(detected_labels[i][0], ""), p)
+                 for p, _, i in others]
+            )
 
         return (winner_type, winner_score)
 
@@ -569,17 +665,15 @@ class ConflictResolver:
         Returns:
             PIIEntity with all fields populated
         """
-        entity = PIIEntity(
+        # Ensure source is DetectorSource enum for proper gRPC mapping
+        if isinstance(source, str):
+            source = DetectorSource.GLINER
+        return PIIEntity(
             text=text,
             pii_type=pii_type,
             type_label=pii_type,
             start=start,
             end=end,
-            score=score
-        )
-        # Ensure source is DetectorSource enum for proper gRPC mapping
-        if isinstance(source, str):
-            entity.source = DetectorSource.GLINER
-        else:
-            entity.source = source
-        return entity
\ No newline at end of file
+            score=score,
+            source=source
+        )
\ No newline at end of file
@@ -26,9 +26,10 @@ Why Load from Database?
 
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pii_detector.application.config.detection_policy import DetectionConfig
 from pii_detector.domain.entity.detector_source import DetectorSource
@@ -38,27 +39,39 @@ from pii_detector.infrastructure.detector.conflict_resolver import (
     ConflictResolver,
 )
 from pii_detector.infrastructure.detector.gliner_detector import GLiNERDetector
+from pii_detector.infrastructure.detector.pass_batcher import PassBatcher
 
 
-@dataclass(frozen=True, slots=True)
-class SpanKey:
-    """Key for grouping entities by span position."""
-    start: int
-    end: int
-
-
-@dataclass
+@dataclass(slots=True)
 class AggregatedSpan:
     """Represents a span with all detected labels from different passes."""
     start: int
     end: int
     text: str
     labels: List[Tuple[str, float]]  # List of (pii_type, score) tuples
+    # Distinct PII types in labels, maintained alongside them by add_label()
+    types: Set[str] = field(init=False, repr=False, compare=False)
+    # Highest-scoring label so far (first one wins ties), also kept by add_label()
+    best_label: Optional[str] = field(init=False, repr=False, compare=False)
+    best_score: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.types = {label for label, _ in self.labels}
+        self.best_label, self.best_score = (
+            max(self.labels, key=itemgetter(1)) if self.labels else (None, float("-inf"))
+        )
+
+    def add_label(self, pii_type: str, score: float) -> None:
+        """Record a detected label, keeping the distinct types and best label in sync."""
+        self.labels.append((pii_type, score))
+        self.types.add(pii_type)
+        if score > self.best_score:
+            self.best_label = pii_type
+            self.best_score = score
 
     def has_conflict(self) -> bool:
         """Returns True if multiple different labels were detected for this span."""
-        unique_types = set(label for label, _ in self.labels)
-        return len(unique_types) > 1
+        return len(self.types) > 1
 
 
 class MultiPassGlinerDetector:
@@ -117,13 +130,27 @@ class MultiPassGlinerDetector:
         # Conflict resolver - initialized after loading categories
         self._conflict_resolver: Optional[ConflictResolver] = None
 
+        # "[PII_TYPE]" mask strings, built once per type on first use
+        self._mask_cache: Dict[str, str] = {}
+
         # Load parallel processing config
         self._load_parallel_config()
 
         # Initialize persistent executor
         self.executor = None
         if self.parallel_enabled:
-            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="gliner-pass"
+            )
+
+        # Optional micro-batching of the same pass across concurrent requests
+        self._batcher: Optional[PassBatcher] = None
+        if self.cross_request_batching:
+            self._batcher = PassBatcher(
+                self._predict_pass_batch,
+                max_batch=self.cross_request_batch_size,
+                max_wait_ms=self.cross_request_max_wait_ms,
+            )
 
         self.logger.info(
             f"MultiPassGlinerDetector initialized with {self.max_workers} workers "
@@ -139,10 +166,18 @@ class MultiPassGlinerDetector:
             parallel_config = config.get("parallel_processing", {})
             self.parallel_enabled = parallel_config.get("enabled", True)
             self.max_workers = parallel_config.get("max_workers", 10)
+            self.cross_request_batching = bool(parallel_config.get("cross_request_batching", False))
+            self.cross_request_batch_size = max(1, int(parallel_config.get("cross_request_batch_size", 8)))
+            self.cross_request_max_wait_ms = max(
+                0.0, float(parallel_config.get("cross_request_max_wait_ms", 0))
+            )
         except Exception as e:
-            self.logger.debug(f"Failed to load parallel config: {e}, using defaults")
+            self.logger.debug("Failed to load parallel config: %s, using defaults", e)
             self.parallel_enabled = True
             self.max_workers = 10
+            self.cross_request_batching = False
+            self.cross_request_batch_size = 8
+            self.cross_request_max_wait_ms = 0.0
 
     def _load_categories_from_database(self) -> None:
         """
@@ -191,13 +226,14 @@ class MultiPassGlinerDetector:
             # Log summary
             total_types = sum(len(labels) for labels in self._pass_categories.values())
             self.logger.info(
-                f"Loaded {total_types} PII types from database, optimized into {len(self._pass_categories)} passes (limit={limit})"
+                "Loaded %s PII types from database, optimized into %s passes (limit=%s)",
+                total_types, len(self._pass_categories), limit
             )
             for pass_name, labels in sorted(self._pass_categories.items()):
-                self.logger.info(f"  {pass_name}: {len(labels)} labels")
+                self.logger.info("  %s: %s labels", pass_name, len(labels))
 
         except Exception as e:
-            self.logger.error(f"Failed to load categories from database: {e}")
+            self.logger.error("Failed to load categories from database: %s", e)
             self._use_fallback_categories()
 
     def _optimize_passes(self, pii_type_configs: dict, limit: int) -> Dict[str, Dict[str, str]]:
@@ -349,6 +385,10 @@ class MultiPassGlinerDetector:
         if not self._gliner_detector.model:
             raise ModelNotLoadedError("Model must be loaded before detection")
 
+        # Nothing to detect: skip category setup and the pass executor entirely
+        if not text or text.isspace():
+            return []
+
         # Use passed pii_type_configs to build dynamic categories if provided
         # Otherwise fallback to loaded categories
         pass_categories = self._pass_categories
@@ -362,9 +402,11 @@ class MultiPassGlinerDetector:
                 for pii_type in labels.values():
                     pii_type_to_category[pii_type] = category
             
-            # Initialize conflict resolver with dynamic config
-            self._pii_type_to_category = pii_type_to_category
-            self._conflict_resolver = ConflictResolver(pii_type_to_category)
+            # Rebuild the conflict resolver only when the DB config actually changed;
+            # the same configs arrive with nearly every request
+            if self._conflict_resolver is None or pii_type_to_category != self._pii_type_to_category:
+                self._pii_type_to_category = pii_type_to_category
+                self._conflict_resolver = ConflictResolver(pii_type_to_category)
         elif self._pass_categories is None:
             # Load categories from database on first call if no config passed
             self._load_categories_from_database()
@@ -375,11 +417,11 @@ class MultiPassGlinerDetector:
         categories_to_run = categories or list(pass_categories.keys())
 
         self.logger.info(
-            f"[{detection_id}] Starting multi-pass detection on {len(text)} chars "
-            f"with {len(categories_to_run)} categories, threshold={threshold}"
+            "[%s] Starting multi-pass detection on %s chars with %s categories, threshold=%s",
+            detection_id, len(text), len(categories_to_run), threshold
         )
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Step 1: Run parallel passes
@@ -387,28 +429,36 @@ class MultiPassGlinerDetector:
                 text, threshold, detection_id, categories_to_run, pass_categories
             )
 
-            # Step 2: Aggregate by span
-            aggregated_spans = self._aggregate_by_span(all_entities)
+            if len(categories_to_run) == 1:
+                # A single flat-NER pass yields one label per span, so there
+                # is nothing to aggregate or resolve
+                span_count = resolved_count = len(all_entities)
+                resolved_entities = all_entities
+            else:
+                # Step 2: Aggregate by span
+                aggregated_spans = self._aggregate_by_span(all_entities)
+                span_count = len(aggregated_spans)
 
-            # Step 3: Resolve conflicts
-            resolved_entities = self._resolve_conflicts(aggregated_spans, detection_id)
+                # Step 3: Resolve conflicts
+                resolved_entities = self._resolve_conflicts(aggregated_spans, detection_id)
+                resolved_count = len(resolved_entities)
 
             # Step 4: Handle overlapping spans (wider span wins)
             final_entities = self._resolve_overlapping_spans(resolved_entities)
 
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             # Log comprehensive summary
             self._log_detection_summary(
                 detection_id, elapsed, len(text),
                 len(categories_to_run), len(all_entities),
-                len(aggregated_spans), len(resolved_entities), len(final_entities)
+                span_count, resolved_count, len(final_entities)
             )
 
             return final_entities
 
         except Exception as e:
-            self.logger.error(f"[{detection_id}] Multi-pass detection failed: {e}")
+            self.logger.error("[%s] Multi-pass detection failed: %s", detection_id, e)
             raise PIIDetectionError(f"Multi-pass detection failed: {e}") from e
 
     def mask_pii(
@@ -427,16 +477,9 @@ class MultiPassGlinerDetector:
             Tuple of (masked_text, detected_entities)
         """
         entities = self.detect_pii(text, threshold)
+        masked_text = self._apply_masks(text, entities)
 
-        # Sort by position (reverse) to mask from end to start
-        entities_sorted = sorted(entities, key=lambda e: e.start, reverse=True)
-        masked_text = text
-
-        for entity in entities_sorted:
-            mask = f"[{entity.pii_type}]"
-            masked_text = masked_text[:entity.start] + mask + masked_text[entity.end:]
-
-        self.logger.info(f"Masked {len(entities)} PII entities")
+        self.logger.info("Masked %s PII entities", len(entities))
         return masked_text, entities
 
     def _run_parallel_passes(
@@ -467,20 +510,21 @@ class MultiPassGlinerDetector:
 
         if self.parallel_enabled and self.executor and len(categories) > 1:
             self.logger.info(
-                f"[{detection_id}] Running {len(categories)} passes in parallel "
-                f"with {self.max_workers} workers"
+                "[%s] Running %s passes in parallel with %s workers",
+                detection_id, len(categories), self.max_workers
             )
 
-            future_to_category = {
+            futures = [
                 self.executor.submit(
                     self._run_single_pass,
                     text, threshold, detection_id, category, pass_categories
-                ): category
+                )
                 for category in categories
-            }
+            ]
 
-            for future in as_completed(future_to_category):
-                category = future_to_category[future]
+            # All passes are awaited anyway; collecting in submission order keeps
+            # the entity order (and thus tie-breaking downstream) deterministic
+            for category, future in zip(categories, futures):
                 try:
                     entities = future.result()
                     all_entities.extend(entities)
@@ -490,18 +534,21 @@ class MultiPassGlinerDetector:
                     )
                 except Exception as e:
                     self.logger.error(
-                        f"[{detection_id}] Pass {category} failed: {e}"
+                        "[%s] Pass %s failed: %s", detection_id, category, e
                     )
+                    # Don't leave the shared pool running passes of a failed request
+                    for pending in futures:
+                        pending.cancel()
                     raise
         else:
             # Sequential fallback
-            self.logger.info(f"[{detection_id}] Running {len(categories)} passes sequentially")
+            self.logger.info("[%s] Running %s passes sequentially", detection_id, len(categories))
             for category in categories:
                 entities = self._run_single_pass(text, threshold, detection_id, category, pass_categories)
                 all_entities.extend(entities)
 
         self.logger.info(
-            f"[{detection_id}] All passes complete: {len(all_entities)} total entities"
+            "[%s] All passes complete: %s total entities", detection_id, len(all_entities)
         )
         return all_entities
 
@@ -527,51 +574,50 @@ class MultiPassGlinerDetector:
             Entities detected in this pass
         """
         if category not in pass_categories:
-            self.logger.warning(f"[{detection_id}] Unknown category: {category}")
+            self.logger.warning("[%s] Unknown category: %s", detection_id, category)
             return []
 
         label_mapping = pass_categories[category]
         labels = list(label_mapping.keys())
 
-        pass_start = time.time()
+        pass_start = time.perf_counter()
 
         # Use GLiNER's model directly to predict with specific labels
-        raw_entities = self._gliner_detector.model.predict_entities(
-            text,
-            labels,
-            threshold=threshold
-        )
+        if self._batcher is not None:
+            raw_entities = self._batcher.predict(text, labels, threshold)
+        else:
+            raw_entities = self._gliner_detector.model.predict_entities(
+                text,
+                labels,
+                threshold=threshold
+            )
 
-        # Convert to PIIEntity format
+        # Convert to PIIEntity format, tolerating malformed results
+        mapping_get = label_mapping.get
+        text_len = len(text)
+        gliner = DetectorSource.GLINER
         entities = []
         for entity in raw_entities:
             gliner_label = entity.get("label", "")
-            pii_type = label_mapping.get(gliner_label, gliner_label.upper())
+            pii_type = mapping_get(gliner_label) or gliner_label.upper()
 
             start = entity.get("start", 0)
             end = entity.get("end", 0)
-            actual_text = text[start:end] if 0 <= start < end <= len(text) else ""
-
-            pii_entity = PIIEntity(
-                text=actual_text,
-                pii_type=pii_type,
-                type_label=pii_type,
-                start=start,
-                end=end,
-                score=entity.get("score", 0.0)
-            )
-            pii_entity.source = DetectorSource.GLINER
-            entities.append(pii_entity)
+            actual_text = text[start:end] if 0 <= start < end <= text_len else ""
+
+            entities.append(PIIEntity(
+                actual_text, pii_type, pii_type, start, end, entity.get("score", 0.0), gliner
+            ))
 
-        pass_time = time.time() - pass_start
+        pass_time = time.perf_counter() - pass_start
 
         # Log pass results
         if entities:
-            entity_types = [e.pii_type for e in entities]
-            self.logger.info(
-                f"[{detection_id}] Pass {category}: {len(entities)} entities in {pass_time:.2f}s - "
-                f"types: {set(entity_types)}"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "[%s] Pass %s: %s entities in %.2fs - types: %s",
+                    detection_id, category, len(entities), pass_time, {e.pii_type for e in entities}
+                )
         else:
             self.logger.debug(
                 "[%s] Pass %s: 0 entities in %.2fs",
@@ -580,6 +626,15 @@ class MultiPassGlinerDetector:
 
         return entities
 
+    def _predict_pass_batch(
+        self,
+        texts: List[str],
+        labels: List[str],
+        threshold: float
+    ) -> List[List[Dict[str, Any]]]:
+        """Run one pass over texts from concurrent requests in a single GLiNER call."""
+        return self._gliner_detector.model.batch_predict_entities(texts, labels, threshold=threshold)
+
     def _aggregate_by_span(
         self,
         entities: List[PIIEntity]
@@ -596,10 +651,11 @@ class MultiPassGlinerDetector:
         Returns:
             Aggregated spans with all labels
         """
-        span_map: Dict[SpanKey, AggregatedSpan] = {}
+        # Plain (start, end) tuples hash and compare in C, no key object per entity
+        span_map: Dict[Tuple[int, int], AggregatedSpan] = {}
 
         for entity in entities:
-            key = SpanKey(entity.start, entity.end)
+            key = (entity.start, entity.end)
             span = span_map.get(key)
 
             if span is None:
@@ -611,7 +667,7 @@ class MultiPassGlinerDetector:
                 )
                 span_map[key] = span
 
-            span.labels.append((entity.pii_type, entity.score))
+            span.add_label(entity.pii_type, entity.score)
 
         return list(span_map.values())
 
@@ -636,19 +692,19 @@ class MultiPassGlinerDetector:
 
         for span in spans:
             if not span.has_conflict():
-                # Single label - accept the highest score
+                # Single label - accept the highest score, tracked during aggregation
                 single_label_count += 1
-                best_label, best_score = max(span.labels, key=lambda x: x[1])
-                entity = PIIEntity(
+                best_label = span.best_label
+                best_score = span.best_score
+                resolved.append(PIIEntity(
                     text=span.text,
                     pii_type=best_label,
                     type_label=best_label,
                     start=span.start,
                     end=span.end,
-                    score=best_score
-                )
-                entity.source = DetectorSource.GLINER
-                resolved.append(entity)
+                    score=best_score,
+                    source=DetectorSource.GLINER
+                ))
 
                 # Log single-label detections at debug level
                 if self.logger.isEnabledFor(logging.DEBUG):
@@ -663,7 +719,8 @@ class MultiPassGlinerDetector:
                 result = self._conflict_resolver.resolve(
                     span.text,
                     span.labels,
-                    detection_id
+                    detection_id,
+                    detected_types=span.types
                 )
                 if result:
                     winner_type, winner_score = result
@@ -752,29 +809,31 @@ class MultiPassGlinerDetector:
             resolved_count: Entities after conflict resolution
             final_count: Final entities after overlap removal
         """
-        # Get conflict stats if available
-        conflict_stats = {}
-        if self._conflict_resolver:
-            conflict_stats = self._conflict_resolver.get_conflict_stats()
+        # The multi-line summary is only built when INFO is actually emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            # Get conflict stats if available
+            conflict_stats = {}
+            if self._conflict_resolver:
+                conflict_stats = self._conflict_resolver.get_conflict_stats()
 
-        # Calculate derived metrics
-        conflicts_resolved = conflict_stats.get("total_conflicts", 0)
-        overlaps_removed = resolved_count - final_count
+            # Calculate derived metrics
+            conflicts_resolved = conflict_stats.get("total_conflicts", 0)
+            overlaps_removed = resolved_count - final_count
 
-        self.logger.info(
-            f"\n{'='*70}\n"
-            f"[{detection_id}] MULTI-PASS DETECTION SUMMARY\n"
-            f"{'='*70}\n"
-            f"  Input:      {text_length:,} chars | {num_categories} categories\n"
-            f"  Pipeline:   {raw_count} raw -> {span_count} spans -> {resolved_count} resolved -> {final_count} final\n"
-            f"  Conflicts:  {conflicts_resolved} resolved "
-            f"(pattern: {conflict_stats.get('resolved_by_pattern', 0)}, "
-            f"fallback: {conflict_stats.get('resolved_by_fallback', 0)}, "
-            f"category: {conflict_stats.get('resolved_by_category', 0)})\n"
-            f"  Overlaps:   {overlaps_removed} removed\n"
-            f"  Time:       {elapsed:.3f}s ({elapsed/num_categories*1000:.1f}ms per category)\n"
-            f"{'='*70}"
-        )
+            self.logger.info(
+                f"\n{'='*70}\n"
+                f"[{detection_id}] MULTI-PASS DETECTION SUMMARY\n"
+                f"{'='*70}\n"
+                f"  Input:      {text_length:,} chars | {num_categories} categories\n"
+                f"  Pipeline:   {raw_count} raw -> {span_count} spans -> {resolved_count} resolved -> {final_count} final\n"
+                f"  Conflicts:  {conflicts_resolved} resolved "
+                f"(pattern: {conflict_stats.get('resolved_by_pattern', 0)}, "
+                f"fallback: {conflict_stats.get('resolved_by_fallback', 0)}, "
+                f"category: {conflict_stats.get('resolved_by_category', 0)})\n"
+                f"  Overlaps:   {overlaps_removed} removed\n"
+                f"  Time:       {elapsed:.3f}s ({elapsed/num_categories*1000:.1f}ms per category)\n"
+                f"{'='*70}"
+            )
 
         # Reset conflict stats for next detection
         if self._conflict_resolver:
@@ -819,34 +878,48 @@ class MultiPassGlinerDetector:
                     'type': entity.get('type', entity.get('pii_type', 'PII'))
                 })
 
-        # Sort by position (reverse) to mask from end to start
-        mask_data.sort(key=lambda e: e['start'], reverse=True)
+        # Sort by start position for a single linear scan
+        mask_data.sort(key=itemgetter('start'))
 
-        masked_text = content
+        parts = []
+        last_pos = 0
+        content_len = len(content)
+        masks = self._mask_cache
         for item in mask_data:
             start = item['start']
             end = item['end']
+
+            # Skip invalid spans and spans overlapping an already masked one
+            if not (0 <= start < end <= content_len) or start < last_pos:
+                continue
+
             pii_type = item['type']
+            mask = masks.get(pii_type)
+            if mask is None:
+                mask = masks[pii_type] = f"[{pii_type}]"
+            parts.append(content[last_pos:start])
+            parts.append(mask)
+            last_pos = end
 
-            if 0 <= start < end <= len(masked_text):
-                mask = f"[{pii_type}]"
-                masked_text = masked_text[:start] + mask + masked_text[end:]
+        # Append remaining text
+        parts.append(content[last_pos:])
 
-        return masked_text
+        return "".join(parts)
 
-    def __del__(self):
-        """Cleanup when detector is destroyed."""
-        try:
-            if hasattr(self, 'executor') and self.executor:
-                self.executor.shutdown(wait=True)
-                self.executor = None
+    def close(self) -> None:
+        """
+        Shut down the pass executor and release the underlying GLiNER detector.
 
-            if hasattr(self, '_gliner_detector'):
-                del self._gliner_detector
-        except Exception as e:
-            # During interpreter shutdown, logging might fail
-            try:
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Cleanup error: {e}")
-            except Exception:
-                pass
\ No newline at end of file
+        Call explicitly or use ``with MultiPassGlinerDetector(...)`` so worker
+        threads and model memory are released at a known point.
+        """
+        executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._gliner_detector.close()
+
+    def __enter__(self) -> "MultiPassGlinerDetector":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
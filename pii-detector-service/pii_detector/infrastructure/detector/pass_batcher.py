@@ -0,0 +1,150 @@
+"""
+Cross-request micro-batching for Multi-Pass GLiNER detection.
+
+Concurrent gRPC requests each run the same detection passes (one label set
+per category) against the shared GLiNER model. Without batching, every
+request issues its own forward pass per category. PassBatcher coalesces
+concurrent calls that use the same labels and threshold into a single
+``batch_predict_entities`` call and hands each caller its own slice of the
+results.
+
+Batching Strategy:
+    1. The first caller for a (labels, threshold) key opens a batch and
+       becomes its leader; later callers for the same key join it
+    2. The leader waits while a previous batch for the same key is still
+       running, so batches grow naturally under load
+    3. Otherwise the leader waits at most ``max_wait_ms`` for more callers,
+       or until ``max_batch`` texts have joined
+    4. The leader runs inference for the whole batch; followers block until
+       their results are ready
+
+Design Principles:
+    - No dedicated batching thread: leaders run inference on the caller's
+      own thread, so different categories still run in parallel
+    - With ``max_wait_ms = 0`` an idle service adds no latency; batching
+      only happens when requests actually overlap
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BatchPredictFn = Callable[[List[str], List[str], float], List[List[Dict[str, Any]]]]
+BatchKey = Tuple[Tuple[str, ...], float]
+
+
+class _PendingBatch:
+    """Texts collected for one batched inference call and its outcome."""
+
+    __slots__ = ("texts", "results", "error", "done")
+
+    def __init__(self) -> None:
+        self.texts: List[str] = []
+        self.results: Optional[List[List[Dict[str, Any]]]] = None
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+
+
+class PassBatcher:
+    """Coalesce concurrent same-label GLiNER calls into batched inference."""
+
+    def __init__(self, predict_batch: BatchPredictFn, max_batch: int = 8, max_wait_ms: float = 0.0):
+        """
+        Initialize the batcher.
+
+        Args:
+            predict_batch: Callable running GLiNER on a list of texts with one
+                label set and threshold, returning one entity list per text
+            max_batch: Maximum number of texts per inference call
+            max_wait_ms: Maximum time a batch leader waits for more callers
+                when no inference for its key is running
+        """
+        self._predict_batch = predict_batch
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._cond = threading.Condition()
+        self._open: Dict[BatchKey, _PendingBatch] = {}
+        self._running: Set[BatchKey] = set()
+
+    def predict(self, text: str, labels: Sequence[str], threshold: float) -> List[Dict[str, Any]]:
+        """
+        Run GLiNER on one text, sharing the forward pass with concurrent callers.
+
+        Args:
+            text: Text to analyze
+            labels: GLiNER labels for this pass
+            threshold: Detection threshold
+
+        Returns:
+            Raw GLiNER entities for ``text``
+
+        Raises:
+            Exception: Whatever the batched inference call raised, re-raised
+                in every caller of the failed batch
+        """
+        key: BatchKey = (tuple(labels), threshold)
+        cond = self._cond
+
+        with cond:
+            batch = self._open.get(key)
+            is_leader = batch is None
+            if is_leader:
+                batch = self._open[key] = _PendingBatch()
+            index = len(batch.texts)
+            batch.texts.append(text)
+            if len(batch.texts) >= self.max_batch:
+                # Full: no more joiners, wake the leader
+                del self._open[key]
+                cond.notify_all()
+
+            if is_leader:
+                self._wait_for_turn(key, batch)
+
+        if not is_leader:
+            batch.done.wait()
+        else:
+            try:
+                batch.results = self._predict_batch(batch.texts, list(key[0]), threshold)
+            except BaseException as e:
+                batch.error = e
+            finally:
+                with cond:
+                    self._running.discard(key)
+                    cond.notify_all()
+                batch.done.set()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Batched %d texts for %d labels", len(batch.texts), len(key[0]))
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.results[index]
+
+    def _wait_for_turn(self, key: BatchKey, batch: _PendingBatch) -> None:
+        """
+        Keep the batch open until it may run, then mark its key as running.
+
+        Must be called with the condition held.
+        """
+        cond = self._cond
+        deadline = time.monotonic() + self.max_wait
+
+        while self._open.get(key) is batch:
+            if key in self._running:
+                # Gate on the previous forward pass for this key
+                cond.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            cond.wait(remaining)
+
+        if self._open.get(key) is batch:
+            del self._open[key]
+
+        while key in self._running:
+            cond.wait()
+        self._running.add(key)
@@ -7,6 +7,7 @@ in text content using the Piiranha model with optimizations for memory usage and
 
 import logging
 import time
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 
 import torch
@@ -371,14 +372,20 @@ class PIIDetector:
 
     def _apply_masks(self, text: str, entities: List[PIIEntity]) -> str:
         """Apply masks to detected PII entities."""
-        entities_sorted = sorted(entities, key=lambda x: x.start, reverse=True)
-        masked_text = text
+        parts = []
+        last_pos = 0
 
-        for entity in entities_sorted:
-            mask = f"[{entity.pii_type}]"
-            masked_text = masked_text[:entity.start] + mask + masked_text[entity.end:]
+        for entity in sorted(entities, key=attrgetter('start')):
+            # Skip if entity overlaps with previous one
+            if entity.start < last_pos:
+                continue
+
+            parts.append(text[last_pos:entity.start])
+            parts.append(f"[{entity.pii_type}]")
+            last_pos = entity.end
 
-        return masked_text
+        parts.append(text[last_pos:])
+        return "".join(parts)
 
     def _is_duplicate_entity(self, entity: PIIEntity, existing_entities: List[PIIEntity]) -> bool:
         """Check if an entity with the same span and type already exists."""
@@ -7,6 +7,7 @@ complementing ML-based detectors with rule-based patterns.
 
 import logging
 import re
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -186,7 +187,7 @@ class RegexDetector:
                 final_matches = filtered_matches
             
             # Sort by position
-            final_matches.sort(key=lambda x: x.start)
+            final_matches.sort(key=attrgetter('start'))
             
             self.logger.debug(
                 f"RegexDetector found {len(final_matches)} entities "
@@ -458,14 +459,21 @@ class RegexDetector:
         Returns:
             Masked text
         """
-        # Sort by position (reverse order for replacement)
-        sorted_entities = sorted(entities, key=lambda x: x.start, reverse=True)
+        # Sort by start position for a single linear scan
+        sorted_entities = sorted(entities, key=attrgetter('start'))
         
-        masked_text = text
+        parts = []
+        last_pos = 0
         for entity in sorted_entities:
-            mask = f"[{entity.pii_type}]"
-            masked_text = (
-                masked_text[:entity.start] + mask + masked_text[entity.end:]
-            )
+            # Skip if entity overlaps with previous one
+            if entity.start < last_pos:
+                continue
+
+            parts.append(text[last_pos:entity.start])
+            parts.append(f"[{entity.pii_type}]")
+            last_pos = entity.end
+        
+        # Append remaining text
+        parts.append(text[last_pos:])
         
-        return masked_text
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
@@ -6,7 +6,7 @@ and loading of GLiNER models from Hugging Face.
 """
 
 import logging
-from typing import Any
+from typing import Any, Dict, List
 
 from pii_detector.application.config.detection_policy import DetectionConfig
 from pii_detector.domain.exception.exceptions import ModelLoadError
@@ -50,7 +50,34 @@ class GLiNERModelManager:
         try:
             from gliner import GLiNER
             
-            model = GLiNER.from_pretrained(self.config.model_id)
+            model_settings = self._load_model_settings()
+            onnx_settings = model_settings.get("onnx", {})
+            model = None
+
+            if (self.config.device or 'cpu') == 'cpu':
+                self._configure_cpu_threads(model_settings.get("threads", {}))
+
+            if onnx_settings.get("enabled", False):
+                model = self._load_onnx_model(GLiNER, onnx_settings.get("model_file", "model.onnx"))
+
+            if model is None:
+                model = self._load_pytorch_model(GLiNER)
+
+                if (self.config.device or 'cpu') == 'cpu' and \
+                        model_settings.get("quantization", {}).get("int8_dynamic", False):
+                    model = self._apply_int8_dynamic_quantization(model)
+
+                dtype_name = model_settings.get("precision", {}).get("dtype", "float32")
+                if dtype_name != "float32":
+                    model = self._apply_autocast(model, dtype_name)
+
+                compile_settings = model_settings.get("compile", {})
+                if compile_settings.get("enabled", False):
+                    model = self._apply_torch_compile(
+                        model,
+                        compile_settings.get("mode", "reduce-overhead"),
+                        compile_settings.get("warmup_words", [32])
+                    )
             
             self.logger.info("GLiNER model loaded successfully")
             return model
@@ -63,3 +90,190 @@ class GLiNERModelManager:
         except Exception as e:
             self.logger.error(f"Error loading GLiNER model: {str(e)}")
             raise ModelLoadError(f"Failed to load GLiNER model: {str(e)}") from e
+
+    def _load_model_settings(self) -> Dict[str, Any]:
+        """
+        Load the TOML settings of the configured GLiNER model.
+
+        Looks up the model file in config/models/ whose ``model_id`` matches
+        the configured model.
+
+        Returns:
+            Model settings dictionary, empty if none match or loading fails
+        """
+        from pii_detector.application.config.detection_policy import _load_llm_config
+
+        try:
+            models = _load_llm_config().get("models", {})
+            for model_config in models.values():
+                if model_config.get("model_id") == self.config.model_id:
+                    return model_config
+        except Exception as e:
+            self.logger.debug(f"Failed to load model settings: {e}, using defaults")
+        return {}
+
+    def _load_pytorch_model(self, gliner_class: Any) -> Any:
+        """
+        Load the PyTorch GLiNER model onto the configured device.
+
+        GLiNER loads weights on CPU unless told otherwise, so accelerators are
+        passed as map_location: the state dict is then loaded straight into
+        device memory and the model is moved there once, instead of paying a
+        host-to-device copy of the inputs on a CPU-resident model.
+
+        Args:
+            gliner_class: GLiNER class used for loading
+
+        Returns:
+            PyTorch GLiNER model in eval mode on the configured device
+        """
+        device = self.config.device or 'cpu'
+        if not str(device).startswith(("cuda", "mps")):
+            return gliner_class.from_pretrained(self.config.model_id)
+
+        self.logger.info(f"Loading GLiNER weights directly onto {device}")
+        return gliner_class.from_pretrained(self.config.model_id, map_location=device)
+
+    def _configure_cpu_threads(self, thread_settings: Dict[str, Any]) -> None:
+        """
+        Pin the torch intra-op and inter-op thread pools for CPU inference.
+
+        Transformer math parallelizes inside torch's intra-op pool, so this is
+        the main CPU throughput lever. A value of 0 keeps torch's default (one
+        thread per physical core). The inter-op pool can only be sized before
+        torch first uses it, so a late call is logged and ignored.
+
+        Args:
+            thread_settings: The ``[threads]`` section of the model settings
+        """
+        intra_op = int(thread_settings.get("intra_op", 0))
+        inter_op = int(thread_settings.get("inter_op", 0))
+        if not intra_op and not inter_op:
+            return
+
+        try:
+            import torch
+
+            if intra_op:
+                torch.set_num_threads(intra_op)
+            if inter_op:
+                torch.set_num_interop_threads(inter_op)
+            self.logger.info(f"Configured torch CPU threads: intra_op={intra_op or 'default'}, "
+                             f"inter_op={inter_op or 'default'}")
+        except Exception as e:
+            self.logger.warning(f"Failed to configure torch CPU threads: {str(e)}")
+
+    def _load_onnx_model(self, gliner_class: Any, onnx_model_file: str) -> Any:
+        """
+        Load the ONNX Runtime version of the GLiNER model.
+
+        GLiNER runs the exported graph through an onnxruntime session with
+        ORT_ENABLE_ALL graph optimizations, keeping the predict_entities API.
+        The ONNX file must have been exported beforehand (GLiNER's
+        convert_to_onnx script) into the model directory.
+
+        Args:
+            gliner_class: GLiNER class used for loading
+            onnx_model_file: ONNX file name inside the model directory
+
+        Returns:
+            ONNX-backed GLiNER model, or None to fall back to PyTorch
+        """
+        device = self.config.device or 'cpu'
+        try:
+            model = gliner_class.from_pretrained(
+                self.config.model_id,
+                load_onnx_model=True,
+                load_tokenizer=True,
+                onnx_model_file=onnx_model_file,
+                map_location=device
+            )
+            self.logger.info(f"Loaded ONNX Runtime GLiNER model from {onnx_model_file}")
+            return model
+        except Exception as e:
+            self.logger.warning(f"ONNX model unavailable, falling back to PyTorch: {str(e)}")
+            return None
+
+    def _apply_int8_dynamic_quantization(self, model: Any) -> Any:
+        """
+        Quantize the Linear layers of the GLiNER backbone to INT8.
+
+        Dynamic quantization keeps activations in float and stores Linear
+        weights as int8, halving memory bandwidth on CPU inference. Falls back
+        to the float model if quantization is unavailable.
+
+        Args:
+            model: Loaded GLiNER model
+
+        Returns:
+            The model with its backbone quantized, or unchanged on failure
+        """
+        try:
+            import torch
+
+            model.model = torch.quantization.quantize_dynamic(
+                model.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            self.logger.info("Applied INT8 dynamic quantization to GLiNER backbone")
+        except Exception as e:
+            self.logger.warning(f"INT8 dynamic quantization failed, using float model: {str(e)}")
+        return model
+
+    def _apply_autocast(self, model: Any, dtype_name: str) -> Any:
+        """
+        Run the GLiNER backbone forward under torch.autocast.
+
+        Every GLiNER predict method goes through the backbone forward, so
+        wrapping it once casts matmuls to the reduced precision without
+        touching the weights or the call sites. Falls back to float32 if the
+        dtype or autocast is unavailable.
+
+        Args:
+            model: Loaded GLiNER model
+            dtype_name: torch dtype name ("bfloat16" or "float16")
+
+        Returns:
+            The model with an autocast backbone forward, or unchanged on failure
+        """
+        device = self.config.device or 'cpu'
+        try:
+            import torch
+
+            autocast = torch.autocast(device_type=device, dtype=getattr(torch, dtype_name))
+            model.model.forward = autocast(model.model.forward)
+            self.logger.info(f"Running GLiNER backbone under {dtype_name} autocast on {device}")
+        except Exception as e:
+            self.logger.warning(f"{dtype_name} autocast unavailable, using float32: {str(e)}")
+        return model
+
+    def _apply_torch_compile(self, model: Any, mode: str, warmup_words: List[int]) -> Any:
+        """
+        Compile the GLiNER backbone with torch.compile.
+
+        Compilation uses dynamic shapes because chunk lengths vary. Warmup
+        predictions at several input lengths trigger compilation (and, with
+        "reduce-overhead", CUDA graph capture per shape) at startup rather
+        than on the first requests. Falls back to the eager backbone if
+        torch.compile is unavailable or compilation fails.
+
+        Args:
+            model: Loaded GLiNER model
+            mode: torch.compile mode (e.g. "reduce-overhead")
+            warmup_words: Word counts of the warmup texts
+
+        Returns:
+            The model with its backbone compiled, or unchanged on failure
+        """
+        backbone = model.model
+        try:
+            import torch
+
+            model.model = torch.compile(backbone, mode=mode, dynamic=True)
+            for word_count in warmup_words:
+                model.predict_entities(" ".join(["John"] * word_count), ["person"], threshold=0.5)
+            self.logger.info(f"Compiled GLiNER backbone with torch.compile (mode={mode}, "
+                             f"warmup lengths={warmup_words})")
+        except Exception as e:
+            model.model = backbone
+            self.logger.warning(f"torch.compile failed, using eager model: {str(e)}")
+        return model
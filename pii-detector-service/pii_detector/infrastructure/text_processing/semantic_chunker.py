@@ -134,10 +134,9 @@ class SemanticTextChunker:
                 current_pos = end
             
             self.logger.debug(
-                f"Chunked {len(text)} chars into {len(results)} semantic chunks"
+                "Chunked %s chars into %s semantic chunks in %.2fs",
+                len(text), len(results), time.time() - start_time
             )
-            elapsed_time = time.time() - start_time
-            print(f"[chunk_text] Chunking text completed in {elapsed_time:.2f}s")
             return results
             
         except Exception as e:
@@ -232,7 +231,7 @@ class FallbackChunker:
             offset += self.chunk_chars
         
         self.logger.debug(
-            f"Fallback chunked {len(text)} chars into {len(results)} chunks"
+            "Fallback chunked %s chars into %s chunks", len(text), len(results)
         )
         
         return results
@@ -8,6 +8,7 @@ CONSOLIDATED: Tests the 44 PII types across 7 categories.
 """
 
 import logging
+import re
 
 import pytest
 
@@ -15,6 +16,8 @@ from pii_detector.domain.entity.pii_entity import PIIEntity
 from pii_detector.infrastructure.detector.conflict_resolver import (
     ConflictResolver,
     CONFLICT_GROUPS,
+    _casefold_pattern,
+    _fold_text,
 )
 
 
@@ -26,8 +29,6 @@ class TestConflictResolverInitialization:
         resolver = ConflictResolver()
 
         assert resolver.pii_type_to_category == {}
-        assert len(resolver._compiled_group_patterns) == len(CONFLICT_GROUPS)
-        assert len(resolver._compiled_type_patterns) == len(CONFLICT_GROUPS)
 
     def test_should_initialize_with_category_mapping(self):
         """Test initialization with category mapping provided."""
@@ -41,23 +42,28 @@ class TestConflictResolverInitialization:
         assert resolver.pii_type_to_category == mapping
         assert resolver.pii_type_to_category["IP_ADDRESS"] == "IT_CREDENTIALS"
 
+    def test_should_keep_category_mapping_read_only(self):
+        """Test the mapping is a snapshot that cannot drift from type priorities."""
+        mapping = {"EMAIL": "CONTACT"}
+        resolver = ConflictResolver(pii_type_to_category=mapping)
+
+        mapping["EMAIL"] = "FINANCIAL"
+
+        assert resolver.pii_type_to_category["EMAIL"] == "CONTACT"
+        with pytest.raises(TypeError):
+            resolver.pii_type_to_category["EMAIL"] = "FINANCIAL"
+
     def test_should_precompile_all_patterns(self):
         """Test that all regex patterns are pre-compiled."""
-        resolver = ConflictResolver()
-
         # All group patterns should be compiled
         for group in CONFLICT_GROUPS:
-            assert group.name in resolver._compiled_group_patterns
             # Verify it's a compiled pattern (has match method)
-            assert hasattr(resolver._compiled_group_patterns[group.name], 'match')
+            assert hasattr(group.compiled_group_pattern, 'match')
 
             # All type patterns within group should be compiled
-            assert group.name in resolver._compiled_type_patterns
             for pii_type in group.type_patterns:
-                assert pii_type in resolver._compiled_type_patterns[group.name]
-                assert hasattr(
-                    resolver._compiled_type_patterns[group.name][pii_type], 'match'
-                )
+                assert pii_type in group.compiled_type_patterns
+                assert hasattr(group.compiled_type_patterns[pii_type], 'match')
 
     def test_should_initialize_conflict_stats(self):
         """Test that conflict statistics are initialized to zero."""
@@ -424,6 +430,72 @@ class TestBuildPIIEntity:
         assert entity.end == 26
 
 
+class TestRequiredLiteralPrefilter:
+    """Test cases for the group required_literal prefilter."""
+
+    @pytest.mark.parametrize("text", [
+        "192.168.1.1", "123-45-6789", "john@example.com",
+        "https://example.com", "756.1234.5678.90",
+    ])
+    def test_should_only_match_group_when_literal_present(self, text):
+        """Test every group matching the text also contains its required literal."""
+        for group in CONFLICT_GROUPS:
+            if group.required_literal is None:
+                continue
+            if re.match(group.group_pattern, text, re.IGNORECASE):
+                assert group.required_literal in text
+
+    def test_should_skip_group_without_literal(self):
+        """Test spans lacking '@' never resolve through EMAIL_LIKE."""
+        resolver = ConflictResolver()
+
+        result = resolver.resolve("john#example", [("EMAIL", 0.9), ("USERNAME", 0.8)])
+
+        assert result is not None
+        assert resolver.get_conflict_stats()["resolved_by_category"] == 1
+
+
+class TestCaseFoldedPatterns:
+    """Test cases for case-folded pattern compilation."""
+
+    def test_should_lowercase_letters_but_keep_escapes(self):
+        """Test escape sequences such as \\S and \\d survive folding."""
+        assert _casefold_pattern(r"^[A-Z]{2}\d\S+Bearer$") == r"^[a-z]{2}\d\S+bearer$"
+
+    def test_should_match_uppercase_input(self):
+        """Test uppercase spans still resolve like before."""
+        resolver = ConflictResolver()
+
+        result = resolver.resolve(
+            "HTTPS://EXAMPLE.COM/PATH", [("URL", 0.9), ("HOSTNAME", 0.8)]
+        )
+
+        assert result is not None
+        assert result[0] == "URL"
+
+    def test_should_resolve_turkish_name_by_pattern(self):
+        """Test dotless i still counts as a letter, as under re.IGNORECASE."""
+        resolver = ConflictResolver()
+
+        result = resolver.resolve("Yıldız", [("USERNAME", 0.9), ("PERSON_NAME", 0.8)])
+
+        assert result == ("PERSON_NAME", 0.8)
+        assert resolver.get_conflict_stats()["resolved_by_category"] == 0
+
+    @pytest.mark.parametrize("text", [
+        "Yıldız", "Altın", "İsmail", "Straſſe", "\u212aelvin", "ali.yıldız@example.com",
+    ])
+    def test_should_match_like_ignorecase_for_special_letters(self, text):
+        """Test folded matching agrees with re.IGNORECASE on letters that lower() keeps."""
+        for group in CONFLICT_GROUPS:
+            folded = _fold_text(text)
+            expected = bool(re.match(group.group_pattern, text, re.IGNORECASE))
+            assert bool(group.compiled_group_pattern.match(folded)) == expected
+            for pii_type, pattern in group.type_patterns.items():
+                expected = bool(re.match(pattern, text, re.IGNORECASE))
+                assert bool(group.compiled_type_patterns[pii_type].match(folded)) == expected
+
+
 class TestConflictLogging:
     """Test cases for conflict resolution logging."""
 
@@ -51,6 +51,7 @@ class TestGLiNERDetectorChunkingRefactoring:
         # Arrange
         detector = detector_with_mocks
         detector.parallel_enabled = True
+        detector.batch_inference = False
         detector.max_workers = 2
         
         # Mock chunk results (2 chunks)
@@ -101,6 +102,218 @@ class TestGLiNERDetectorChunkingRefactoring:
         assert entities[1].end == 43    # 23 + 20
         assert entities[1].score == 0.95
 
+    def test_should_DetectPII_When_BatchInferenceEnabled(self, detector_with_mocks):
+        """
+        Test PII detection with batched inference.
+
+        Validates that:
+        - All chunks are sent to GLiNER in a single batch_predict_entities call
+        - Per-chunk predict_entities is not used
+        - Positions are adjusted per chunk and duplicates removed
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = True
+        detector.batch_inference = True
+
+        chunk1 = Mock()
+        chunk1.text = "Email: john@example.com"
+        chunk1.start = 0
+
+        chunk2 = Mock()  # Overlapping chunk repeating the same email
+        chunk2.text = "john@example.com and Jane"
+        chunk2.start = 7
+
+        detector.semantic_chunker.chunk_text.return_value = [chunk1, chunk2]
+
+        detector.model.batch_predict_entities.return_value = [
+            [{"text": "john@example.com", "label": "email", "start": 7, "end": 23, "score": 0.95}],
+            [{"text": "john@example.com", "label": "email", "start": 0, "end": 16, "score": 0.95},
+             {"text": "Jane", "label": "first name", "start": 21, "end": 25, "score": 0.8}]
+        ]
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'},
+            'EMAIL': {'enabled': True, 'detector_label': 'email', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        entities = detector._detect_pii_with_chunking(
+            "Email: john@example.com and Jane", 0.5, "test-batch", pii_type_configs
+        )
+
+        # Assert
+        detector.model.batch_predict_entities.assert_called_once()
+        assert detector.model.batch_predict_entities.call_args[0][0] == [chunk1.text, chunk2.text]
+        detector.model.predict_entities.assert_not_called()
+        assert [(e.pii_type, e.start, e.end) for e in entities] == [
+            ("EMAIL", 7, 23),
+            ("GIVENNAME", 28, 32),
+        ]
+
+    def test_should_BucketChunksByLength_When_BatchInferenceEnabled(self, detector_with_mocks):
+        """
+        Test that batched inference groups similar-length chunks.
+
+        Validates that:
+        - Chunks are sent in mini-batches of batch_size sorted by length
+        - Results are mapped back to their originating chunk offsets
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = True
+        detector.batch_inference = True
+        detector.batch_size = 2
+
+        long_chunk = Mock(text="Contact John Smith today", start=0)
+        short_chunk = Mock(text="Hi Jane", start=30)
+        medium_chunk = Mock(text="Call Anna", start=40)
+
+        detector.semantic_chunker.chunk_text.return_value = [long_chunk, short_chunk, medium_chunk]
+
+        def batch_predict(texts, labels, threshold):
+            return [
+                [{"text": text.split()[-1], "label": "first name",
+                  "start": len(text) - len(text.split()[-1]), "end": len(text), "score": 0.9}]
+                for text in texts
+            ]
+
+        detector.model.batch_predict_entities.side_effect = batch_predict
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        entities = detector._detect_pii_with_chunking("x" * 50, 0.5, "test-bucket", pii_type_configs)
+
+        # Assert
+        batches = [call[0][0] for call in detector.model.batch_predict_entities.call_args_list]
+        assert batches == [[short_chunk.text, medium_chunk.text], [long_chunk.text]]
+        assert sorted((e.text, e.start, e.end) for e in entities) == [
+            ("Anna", 45, 49),
+            ("Jane", 33, 37),
+            ("today", 19, 24),
+        ]
+
+    def test_should_SplitBucket_When_ChunkLengthMoreThanDoubles(self, detector_with_mocks):
+        """
+        Test that a short tail chunk is not batched with full-length chunks.
+
+        Validates that:
+        - A bucket closes when the next chunk is over twice its shortest chunk
+        - Similar-length chunks still share a batch below batch_size
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.batch_size = 8
+        chunks = [Mock(text="x" * length) for length in (300, 40, 290, 310)]
+
+        # Act
+        buckets = list(detector._iter_length_buckets([1, 2, 0, 3], chunks))
+
+        # Assert
+        assert buckets == [[1], [2, 0, 3]]
+
+    def test_should_FallBackToSequential_When_BatchInferenceFails(self, detector_with_mocks):
+        """
+        Test that a failing batched GLiNER call is retried chunk by chunk.
+
+        Validates that:
+        - An exception from batch_predict_entities does not fail the detection
+        - Every chunk is then processed with predict_entities
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = True
+        detector.batch_inference = True
+        detector.batch_size = 4
+        detector.chunk_cache_size = 0
+
+        chunk1 = Mock(text="John", start=0)
+        chunk2 = Mock(text="Jane", start=10)
+        detector.semantic_chunker.chunk_text.return_value = [chunk1, chunk2]
+
+        detector.model.batch_predict_entities.side_effect = RuntimeError("out of memory")
+        detector.model.predict_entities.side_effect = [
+            [{"text": "John", "label": "first name", "start": 0, "end": 4, "score": 0.9}],
+            [{"text": "Jane", "label": "first name", "start": 0, "end": 4, "score": 0.9}]
+        ]
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        entities = detector._detect_pii_with_chunking("x" * 20, 0.5, "test-fallback", pii_type_configs)
+
+        # Assert
+        assert detector.model.predict_entities.call_count == 2
+        assert [(e.text, e.start, e.end) for e in entities] == [("John", 0, 4), ("Jane", 10, 14)]
+
+    def test_should_ProcessSequentially_When_BatchSizeIsOne(self, detector_with_mocks):
+        """
+        Test that batch_size = 1 disables batched inference.
+
+        Validates that:
+        - batch_predict_entities is never called
+        - Chunks go through the per-chunk path instead
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = True
+        detector.batch_inference = True
+        detector.batch_size = 1
+        detector.max_workers = 1
+
+        detector.semantic_chunker.chunk_text.return_value = [
+            Mock(text="John", start=0), Mock(text="Jane", start=10)
+        ]
+        detector.model.predict_entities.return_value = []
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        detector._detect_pii_with_chunking("x" * 20, 0.5, "test-batch-one", pii_type_configs)
+
+        # Assert
+        detector.model.batch_predict_entities.assert_not_called()
+        assert detector.model.predict_entities.call_count == 2
+
+    def test_should_UseBatchedInference_When_DeviceIsGpuAndBatchInferenceDisabled(self, detector_with_mocks):
+        """
+        Test that GPU deployments never fan chunks out over threads.
+
+        Validates that:
+        - batch_predict_entities is used on cuda even with batch_inference off
+        - Per-chunk predict_entities is not used
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.device = "cuda"
+        detector.parallel_enabled = True
+        detector.batch_inference = False
+        detector.batch_size = 4
+        detector.chunk_cache_size = 0
+
+        detector.semantic_chunker.chunk_text.return_value = [
+            Mock(text="John", start=0), Mock(text="Jane", start=10)
+        ]
+        detector.model.batch_predict_entities.return_value = [[], []]
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        detector._detect_pii_with_chunking("x" * 20, 0.5, "test-gpu", pii_type_configs)
+
+        # Assert
+        detector.model.batch_predict_entities.assert_called_once()
+        detector.model.predict_entities.assert_not_called()
+
     def test_should_DetectPII_When_SequentialProcessingEnabled(self, detector_with_mocks):
         """
         Test PII detection with sequential processing (parallel disabled).
@@ -112,6 +325,7 @@ class TestGLiNERDetectorChunkingRefactoring:
         # Arrange
         detector = detector_with_mocks
         detector.parallel_enabled = False
+        detector.batch_inference = False
         
         # Mock chunk results (2 chunks)
         chunk1 = Mock()
@@ -157,6 +371,7 @@ class TestGLiNERDetectorChunkingRefactoring:
         # Arrange
         detector = detector_with_mocks
         detector.parallel_enabled = False
+        detector.batch_inference = False
         
         # Mock overlapping chunks with duplicate entity
         chunk1 = Mock()
@@ -211,6 +426,7 @@ class TestGLiNERDetectorChunkingRefactoring:
         # Arrange
         detector = detector_with_mocks
         detector.parallel_enabled = False
+        detector.batch_inference = False
         
         # Mock pii_type_configs with high threshold for EMAIL
         pii_type_configs = {
@@ -272,3 +488,329 @@ class TestGLiNERDetectorChunkingRefactoring:
         
         # Verify model was called once (sequential mode)
         assert detector.model.predict_entities.call_count == 1
+
+    def test_should_ReuseCachedInference_When_ChunkRepeats(self, detector_with_mocks):
+        """
+        Test that repeated chunk text is served from the chunk cache.
+
+        Validates that:
+        - Identical chunks with the same labels and threshold call GLiNER once
+        - Cached entities are re-offset for each chunk position
+        - A different threshold is a cache miss
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = False
+        detector.batch_inference = False
+        detector.chunk_cache_size = 8
+
+        chunk1 = Mock(text="Call Jane", start=0)
+        chunk2 = Mock(text="Call Jane", start=20)
+        detector.semantic_chunker.chunk_text.return_value = [chunk1, chunk2]
+
+        detector.model.predict_entities.return_value = [
+            {"text": "Jane", "label": "first name", "start": 5, "end": 9, "score": 0.9}
+        ]
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        entities = detector._detect_pii_with_chunking("x" * 30, 0.5, "test-cache", pii_type_configs)
+        detector._detect_pii_with_chunking("x" * 30, 0.6, "test-cache", pii_type_configs)
+
+        # Assert
+        assert [(e.start, e.end) for e in entities] == [(5, 9), (25, 29)]
+        assert detector.model.predict_entities.call_count == 2
+
+    def test_should_EvictLeastRecentlyUsed_When_ChunkCacheFull(self, detector_with_mocks):
+        """Test that the chunk cache keeps at most chunk_cache_size entries."""
+        # Arrange
+        detector = detector_with_mocks
+        detector.chunk_cache_size = 2
+        detector.model.predict_entities.return_value = []
+
+        # Act
+        detector._predict_chunk_entities("a", ["email"], 0.5)
+        detector._predict_chunk_entities("b", ["email"], 0.5)
+        detector._predict_chunk_entities("a", ["email"], 0.5)
+        detector._predict_chunk_entities("c", ["email"], 0.5)
+
+        # Assert - "b" was least recently used and evicted, "a" is still cached
+        assert detector._get_cached_chunk_entities(detector._chunk_cache_key("b", ["email"], 0.5)) is None
+        assert detector._get_cached_chunk_entities(detector._chunk_cache_key("a", ["email"], 0.5)) == []
+        assert detector.model.predict_entities.call_count == 3
+
+    def test_should_SkipCachedChunks_When_BatchInferenceEnabled(self, detector_with_mocks):
+        """Test that batched inference only sends cache misses to GLiNER."""
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = True
+        detector.batch_inference = True
+        detector.chunk_cache_size = 8
+
+        chunk1 = Mock(text="Call Jane", start=0)
+        chunk2 = Mock(text="Hello there", start=10)
+        detector.semantic_chunker.chunk_text.return_value = [chunk1, chunk2]
+        detector._put_cached_chunk_entities(
+            detector._chunk_cache_key(chunk1.text, ["first name"], 0.5),
+            [{"text": "Jane", "label": "first name", "start": 5, "end": 9, "score": 0.9}]
+        )
+        detector.model.batch_predict_entities.return_value = [[]]
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        entities = detector._detect_pii_with_chunking("x" * 30, 0.5, "test-cache-batch", pii_type_configs)
+
+        # Assert
+        detector.model.batch_predict_entities.assert_called_once()
+        assert detector.model.batch_predict_entities.call_args[0][0] == [chunk2.text]
+        assert [(e.text, e.start, e.end) for e in entities] == [("Jane", 5, 9)]
+
+    def test_should_KeepHighestScoreEntity_When_DeduplicatingAcrossChunks(self, detector_with_mocks):
+        """Test that exact duplicates keep the highest score and other types are kept."""
+        # Arrange
+        from pii_detector.domain.entity.pii_entity import PIIEntity
+
+        first = PIIEntity("Jane", "GIVENNAME", "GIVENNAME", 5, 9, 0.7)
+        duplicate = PIIEntity("Jane", "GIVENNAME", "GIVENNAME", 5, 9, 0.9)
+        other_type = PIIEntity("Jane", "SURNAME", "SURNAME", 5, 9, 0.6)
+        tie = PIIEntity("Jane", "SURNAME", "SURNAME", 5, 9, 0.6)
+
+        # Act
+        entities = detector_with_mocks._deduplicate_entities([first, duplicate, other_type, tie])
+
+        # Assert
+        assert entities == [duplicate, other_type]
+        assert entities[1] is other_type
+
+    def test_should_KeepOverlappingAndAdjacentSpans_When_BoundariesDiffer(self, detector_with_mocks):
+        """Test that only exact (start, end, pii_type) duplicates are removed."""
+        # Arrange
+        from pii_detector.domain.entity.pii_entity import PIIEntity
+
+        chunk_a = PIIEntity("e Dupont", "SURNAME", "SURNAME", 100, 108, 0.6)
+        chunk_b = PIIEntity("Dupont", "SURNAME", "SURNAME", 102, 108, 0.8)
+        adjacent = PIIEntity("Marie", "SURNAME", "SURNAME", 108, 113, 0.7)
+
+        # Act
+        entities = detector_with_mocks._deduplicate_entities([chunk_a, chunk_b, adjacent])
+
+        # Assert
+        assert entities == [chunk_a, chunk_b, adjacent]
+
+    def test_should_ReuseLabelEmbeddings_When_ModelIsBiEncoder(self, detector_with_mocks):
+        """
+        Test that bi-encoder models encode label prompts once per label set.
+
+        Validates that:
+        - encode_labels is called once for several chunks
+        - Inference goes through predict_with_embeds with the cached embeddings
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = False
+        detector.batch_inference = False
+        detector._supports_label_embeddings = True
+        detector.chunk_cache_size = 0
+
+        chunk1 = Mock(text="Call Jane", start=0)
+        chunk2 = Mock(text="Call Anna", start=10)
+        detector.semantic_chunker.chunk_text.return_value = [chunk1, chunk2]
+        detector.model.predict_with_embeds.return_value = []
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        detector._detect_pii_with_chunking("x" * 20, 0.5, "test-embeds", pii_type_configs)
+        detector._detect_pii_with_chunking("x" * 20, 0.5, "test-embeds", pii_type_configs)
+
+        # Assert
+        detector.model.encode_labels.assert_called_once_with(("first name",))
+        assert detector.model.predict_with_embeds.call_count == 4
+        assert detector.model.predict_with_embeds.call_args[0][1] is detector.model.encode_labels.return_value
+        detector.model.predict_entities.assert_not_called()
+
+    def test_should_KeepLabelEmbeddingsPerLabelSet_When_LabelSetsAlternate(self, detector_with_mocks):
+        """
+        Test that switching between label sets does not re-encode labels.
+
+        Validates that:
+        - Each distinct label set is encoded exactly once
+        - Reloading the model drops the cached embeddings
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector._supports_label_embeddings = True
+        detector.model.encode_labels.side_effect = lambda labels: ("embeds", tuple(labels))
+
+        # Act
+        for _ in range(3):
+            detector._get_label_embeddings(["first name"])
+            detector._get_label_embeddings(["email", "first name"])
+
+        # Assert
+        assert detector.model.encode_labels.call_count == 2
+        assert detector._get_label_embeddings(["email", "first name"]) == ("embeds", ("email", "first name"))
+
+        detector.model_manager.load_model.return_value = detector.model
+        detector.model.config.labels_encoder = "bert-base"
+        detector.load_model()
+        detector._get_label_embeddings(["first name"])
+        assert detector.model.encode_labels.call_count == 3
+
+    def test_should_SkipChunker_When_TextFitsInSingleChunk(self, detector_with_mocks):
+        """
+        Test that short texts bypass semantic chunking.
+
+        Validates that:
+        - The chunker is not invoked when the text is within the token budget in characters
+        - The whole text is analyzed as one chunk at offset 0
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector._single_chunk_max_chars = 378
+        detector.model.predict_entities.return_value = [
+            {"text": "Jane", "label": "first name", "start": 5, "end": 9, "score": 0.9}
+        ]
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        entities = detector._detect_pii_with_chunking("Call Jane", 0.5, "test-short", pii_type_configs)
+
+        # Assert
+        detector.semantic_chunker.chunk_text.assert_not_called()
+        detector.model.predict_entities.assert_called_once_with("Call Jane", ("first name",), threshold=0.5)
+        assert [(e.text, e.start, e.end) for e in entities] == [("Jane", 5, 9)]
+
+    def test_should_UseChunker_When_TextExceedsSingleChunkLimit(self, detector_with_mocks):
+        """Test that texts longer than the single-chunk limit are still chunked."""
+        # Arrange
+        detector = detector_with_mocks
+        detector._single_chunk_max_chars = 5
+        detector.semantic_chunker.chunk_text.return_value = []
+
+        # Act
+        detector._detect_pii_with_chunking("Call Jane", 0.5, "test-long", {})
+
+        # Assert
+        detector.semantic_chunker.chunk_text.assert_called_once_with("Call Jane")
+
+    def test_should_CollectAllChunksInOrder_When_MoreChunksThanParallelWindow(self, detector_with_mocks):
+        """
+        Test that the sliding submission window processes every chunk.
+
+        Validates that:
+        - More chunks than the in-flight window (2 * max_workers) are all processed
+        - Results are returned in chunk order regardless of completion order
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = True
+        detector.batch_inference = False
+        detector.chunk_cache_size = 0
+        detector.max_workers = 1
+
+        chunks = [Mock(text=f"Name{i}", start=i * 10) for i in range(7)]
+        detector.semantic_chunker.chunk_text.return_value = chunks
+        detector.model.predict_entities.side_effect = lambda text, labels, threshold: [
+            {"text": text, "label": "first name", "start": 0, "end": len(text), "score": 0.9}
+        ]
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        entities = detector._detect_pii_with_chunking("x" * 80, 0.5, "test-window", pii_type_configs)
+
+        # Assert
+        assert [e.start for e in entities] == [i * 10 for i in range(7)]
+        assert detector.model.predict_entities.call_count == 7
+
+    def test_should_ReuseThreadPool_When_ParallelCallsRepeat(self, detector_with_mocks):
+        """
+        Test that one chunk thread pool serves every detection call.
+
+        Validates that:
+        - The pool created by the first parallel call is reused by the next one
+        - close() shuts the pool down
+        """
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = True
+        detector.batch_inference = False
+        detector.chunk_cache_size = 0
+        detector.max_workers = 2
+
+        detector.semantic_chunker.chunk_text.return_value = [
+            Mock(text="a", start=0), Mock(text="b", start=2)
+        ]
+        detector.model.predict_entities.return_value = []
+
+        # Act
+        detector._detect_pii_with_chunking("a b", 0.5, "test-pool-1", {})
+        executor = detector._executor
+        detector._detect_pii_with_chunking("a b", 0.5, "test-pool-2", {})
+
+        # Assert
+        assert executor is not None
+        assert detector._executor is executor
+
+        detector.close()
+        assert detector._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+    def test_should_PropagateError_When_ParallelChunkFails(self, detector_with_mocks):
+        """Test that a failing chunk aborts parallel processing with the original error."""
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = True
+        detector.batch_inference = False
+        detector.chunk_cache_size = 0
+        detector.max_workers = 2
+
+        detector.semantic_chunker.chunk_text.return_value = [
+            Mock(text="a", start=0), Mock(text="b", start=2)
+        ]
+        detector.model.predict_entities.side_effect = RuntimeError("inference failed")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="inference failed"):
+            detector._detect_pii_with_chunking("a b", 0.5, "test-error", {})
+
+    def test_should_KeepPassingDuplicate_When_FirstChunkScoreBelowThreshold(self, detector_with_mocks):
+        """Test that thresholds apply before cross-chunk deduplication."""
+        # Arrange
+        detector = detector_with_mocks
+        detector.parallel_enabled = False
+        detector.batch_inference = False
+        detector.chunk_cache_size = 0
+
+        detector.semantic_chunker.chunk_text.return_value = [
+            Mock(text="Call Jane", start=0), Mock(text="Jane now", start=5)
+        ]
+        detector.model.predict_entities.side_effect = [
+            [{"text": "Jane", "label": "first name", "start": 5, "end": 9, "score": 0.4}],
+            [{"text": "Jane", "label": "first name", "start": 0, "end": 4, "score": 0.9}],
+        ]
+
+        pii_type_configs = {
+            'GIVENNAME': {'enabled': True, 'detector_label': 'first name', 'threshold': 0.5, 'detector': 'GLINER'}
+        }
+
+        # Act
+        entities = detector._detect_pii_with_chunking("Call Jane now", 0.3, "test-fused", pii_type_configs)
+
+        # Assert
+        assert [(e.start, e.end, e.score) for e in entities] == [(5, 9, 0.9)]
@@ -83,6 +83,7 @@ class TestGLiNERDetectorLoadModel:
         mock_model.data_processor = Mock()
         mock_model.data_processor.config = Mock()
         mock_model.data_processor.config.tokenizer = None
+        mock_model.data_processor.transformer_tokenizer = None
         
         # Configure model name for fallback
         mock_model.config = Mock()
@@ -108,8 +109,70 @@ class TestGLiNERDetectorLoadModel:
                 assert detector.model == mock_model
                 assert detector.semantic_chunker == mock_chunker
                 
-                # Verify AutoTokenizer.from_pretrained was called with model name
-                mock_from_pretrained.assert_called_once_with("bert-base-cased")
+                # Verify the fast tokenizer was loaded from the local cache by model name
+                mock_from_pretrained.assert_called_once_with(
+                    "bert-base-cased", use_fast=True, local_files_only=True
+                )
+
+    def test_should_ReuseGlinerTokenizer_When_DataProcessorHoldsTransformerTokenizer(self, detector):
+        """
+        Test that the tokenizer already loaded by GLiNER is reused.
+
+        No AutoTokenizer load should happen when the data processor exposes
+        its transformer tokenizer.
+        """
+        # Arrange
+        mock_model = Mock()
+        mock_tokenizer = Mock()
+        mock_model.data_processor = Mock()
+        mock_model.data_processor.config = Mock()
+        mock_model.data_processor.config.tokenizer = None
+        mock_model.data_processor.transformer_tokenizer = mock_tokenizer
+
+        detector.model_manager.load_model = Mock(return_value=mock_model)
+
+        mock_chunker = Mock()
+        mock_chunker.get_chunk_info = Mock(return_value={"library": "fallback"})
+
+        with patch('pii_detector.infrastructure.detector.gliner_detector.create_chunker',
+                   return_value=mock_chunker) as mock_create:
+            with patch('transformers.AutoTokenizer.from_pretrained') as mock_from_pretrained:
+                # Act
+                detector.load_model()
+
+                # Assert
+                mock_from_pretrained.assert_not_called()
+                assert mock_create.call_args.kwargs['tokenizer'] is mock_tokenizer
+
+    def test_should_DownloadTokenizer_When_NotCachedLocally(self, detector):
+        """
+        Test that the network download is only attempted after a local cache miss.
+        """
+        # Arrange
+        mock_model = Mock()
+        mock_model.data_processor = Mock()
+        mock_model.data_processor.config = Mock()
+        mock_model.data_processor.config.tokenizer = None
+        mock_model.data_processor.transformer_tokenizer = None
+        mock_model.config = Mock()
+        mock_model.config.model_name = "bert-base-cased"
+
+        detector.model_manager.load_model = Mock(return_value=mock_model)
+
+        mock_auto_tokenizer = Mock()
+        mock_chunker = Mock()
+        mock_chunker.get_chunk_info = Mock(return_value={"library": "fallback"})
+
+        with patch('pii_detector.infrastructure.detector.gliner_detector.create_chunker',
+                   return_value=mock_chunker):
+            with patch('transformers.AutoTokenizer.from_pretrained',
+                       side_effect=[OSError("not cached"), mock_auto_tokenizer]) as mock_from_pretrained:
+                # Act
+                detector.load_model()
+
+                # Assert
+                assert mock_from_pretrained.call_args_list[1].args == ("bert-base-cased",)
+                assert mock_from_pretrained.call_args_list[1].kwargs == {"use_fast": True}
 
     def test_should_LoadModel_When_ChunkerUsesFallbackLibrary(self, detector):
         """
@@ -187,6 +250,7 @@ class TestGLiNERDetectorLoadModel:
         mock_model.data_processor.config = Mock()
         # Make getattr return None (simulating missing tokenizer attribute)
         type(mock_model.data_processor.config).tokenizer = property(lambda self: None)
+        mock_model.data_processor.transformer_tokenizer = None
         
         mock_model.config = Mock()
         mock_model.config.model_name = "bert-base-cased"
@@ -7,6 +7,7 @@ covering multi-pass detection, conflict resolution, and span aggregation.
 Uses mocking to avoid GPU/model dependencies.
 """
 
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -18,41 +19,9 @@ from pii_detector.domain.exception.exceptions import ModelNotLoadedError
 from pii_detector.infrastructure.detector.conflict_resolver import ConflictResolver
 from pii_detector.infrastructure.detector.multi_pass_gliner_detector import (
     MultiPassGlinerDetector,
-    SpanKey,
     AggregatedSpan,
 )
-
-
-class TestSpanKey:
-    """Test cases for SpanKey dataclass."""
-
-    def test_should_be_hashable(self):
-        """Test SpanKey can be used as dict key."""
-        key1 = SpanKey(start=0, end=10)
-        key2 = SpanKey(start=0, end=10)
-        key3 = SpanKey(start=5, end=15)
-
-        test_dict = {key1: "value1"}
-        test_dict[key2] = "value2"  # Should overwrite
-        test_dict[key3] = "value3"
-
-        assert len(test_dict) == 2
-        assert test_dict[key1] == "value2"
-
-    def test_should_compare_equal_with_same_values(self):
-        """Test SpanKey equality."""
-        key1 = SpanKey(start=10, end=20)
-        key2 = SpanKey(start=10, end=20)
-
-        assert key1 == key2
-        assert hash(key1) == hash(key2)
-
-    def test_should_compare_not_equal_with_different_values(self):
-        """Test SpanKey inequality."""
-        key1 = SpanKey(start=0, end=10)
-        key2 = SpanKey(start=0, end=15)
-
-        assert key1 != key2
+from pii_detector.infrastructure.detector.pass_batcher import PassBatcher
 
 
 class TestAggregatedSpan:
@@ -91,6 +60,27 @@ class TestAggregatedSpan:
 
         assert span.has_conflict() is False
 
+    def test_should_track_types_when_adding_labels(self):
+        """Test add_label keeps the distinct type set in sync with labels."""
+        span = AggregatedSpan(start=0, end=11, text="192.168.1.1", labels=[])
+
+        span.add_label("IP_ADDRESS", 0.90)
+        assert span.has_conflict() is False
+
+        span.add_label("AVS_NUMBER", 0.85)
+        assert span.types == {"IP_ADDRESS", "AVS_NUMBER"}
+        assert span.has_conflict() is True
+
+    def test_should_track_best_label_when_adding_labels(self):
+        """Test the highest-scoring label is kept, the first one winning ties."""
+        span = AggregatedSpan(start=0, end=8, text="John Doe", labels=[("PERSON_NAME", 0.80)])
+
+        span.add_label("PERSON_NAME", 0.92)
+        span.add_label("USERNAME", 0.92)
+        span.add_label("PERSON_NAME", 0.70)
+
+        assert (span.best_label, span.best_score) == ("PERSON_NAME", 0.92)
+
 
 class TestMultiPassDetectorInitialization:
     """Test cases for MultiPassGlinerDetector initialization."""
@@ -140,6 +130,20 @@ class TestMultiPassDetectorInitialization:
         assert detector.parallel_enabled is False
         assert detector.max_workers == 5
 
+    @patch('pii_detector.application.config.detection_policy._load_llm_config')
+    @patch('pii_detector.infrastructure.detector.multi_pass_gliner_detector.GLiNERDetector')
+    def test_should_read_dedicated_cross_request_batch_size(
+        self, mock_gliner_class, mock_load_config, mock_config
+    ):
+        """Test cross-request batch size is independent of the chunk batch_size."""
+        mock_load_config.return_value = {"parallel_processing": {
+            "batch_size": 2, "cross_request_batch_size": 16
+        }}
+
+        detector = MultiPassGlinerDetector(config=mock_config)
+
+        assert detector.cross_request_batch_size == 16
+
     @patch('pii_detector.application.config.detection_policy._load_llm_config')
     @patch('pii_detector.infrastructure.detector.multi_pass_gliner_detector.GLiNERDetector')
     def test_should_use_default_parallel_config_on_failure(
@@ -158,6 +162,47 @@ class TestMultiPassDetectorInitialization:
         assert detector.parallel_enabled is True
         assert detector.max_workers == 10
 
+    @patch('pii_detector.application.config.detection_policy._load_llm_config')
+    @patch('pii_detector.infrastructure.detector.multi_pass_gliner_detector.GLiNERDetector')
+    def test_should_shutdown_executor_and_release_detector_on_close(
+        self, mock_gliner_class, mock_load_config, mock_config
+    ):
+        """Test close() shuts down the pass executor and closes the GLiNER detector."""
+        mock_load_config.return_value = {"parallel_processing": {"enabled": True, "max_workers": 2}}
+        mock_gliner = Mock()
+        mock_gliner_class.return_value = mock_gliner
+
+        with MultiPassGlinerDetector(config=mock_config) as detector:
+            executor = detector.executor
+
+        assert detector.executor is None
+        mock_gliner.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+    @patch('pii_detector.application.config.detection_policy._load_llm_config')
+    @patch('pii_detector.infrastructure.detector.multi_pass_gliner_detector.GLiNERDetector')
+    def test_should_release_executor_when_closed_through_composite(
+        self, mock_gliner_class, mock_load_config, mock_config
+    ):
+        """Test the composite wrapper used by the service reaches close(), which is repeatable."""
+        from pii_detector.application.orchestration.composite_detector import CompositePIIDetector
+
+        mock_load_config.return_value = {"parallel_processing": {"enabled": True, "max_workers": 2}}
+        mock_gliner_class.return_value = Mock()
+        detector = MultiPassGlinerDetector(config=mock_config)
+        executor = detector.executor
+        composite = CompositePIIDetector(
+            ml_detector=detector, regex_detector=Mock(), enable_presidio=False
+        )
+
+        composite.close()
+        composite.close()
+
+        assert detector.executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
 
 class TestCategoryLoading:
     """Test cases for category loading from database."""
@@ -316,6 +361,26 @@ class TestSinglePassDetection:
         call_args = detector_with_model._gliner_detector.model.predict_entities.call_args
         assert "person name" in call_args[0][1]  # labels argument
 
+    def test_should_use_batched_inference_when_cross_request_batching_enabled(self, detector_with_model):
+        """Test passes go through batch_predict_entities when batching across requests."""
+        detector_with_model._batcher = PassBatcher(detector_with_model._predict_pass_batch)
+        model = detector_with_model._gliner_detector.model
+        model.batch_predict_entities.return_value = [
+            [{"label": "person name", "start": 0, "end": 8, "score": 0.9}]
+        ]
+
+        entities = detector_with_model._run_single_pass(
+            text="John Doe",
+            threshold=0.3,
+            detection_id="test-001",
+            category="IDENTITY",
+            pass_categories=detector_with_model._pass_categories
+        )
+
+        model.batch_predict_entities.assert_called_once_with(["John Doe"], ["person name"], threshold=0.3)
+        model.predict_entities.assert_not_called()
+        assert [(e.text, e.pii_type) for e in entities] == [("John Doe", "PERSON_NAME")]
+
     def test_should_convert_raw_entities_to_pii_entities(self, detector_with_model):
         """Test raw GLiNER output is converted to PIIEntity."""
         detector_with_model._gliner_detector.model.predict_entities.return_value = [
@@ -337,6 +402,25 @@ class TestSinglePassDetection:
         assert result[0].score == 0.92
         assert result[0].source == DetectorSource.GLINER
 
+    def test_should_tolerate_malformed_raw_entities(self, detector_with_model):
+        """Test a raw entity missing positions or score does not abort the pass."""
+        detector_with_model._gliner_detector.model.predict_entities.return_value = [
+            {"label": "person name"},
+            {"label": "person name", "start": 0, "end": 8, "score": 0.92},
+        ]
+
+        result = detector_with_model._run_single_pass(
+            text="John Doe is here",
+            threshold=0.3,
+            detection_id="test-002b",
+            category="IDENTITY",
+            pass_categories=detector_with_model._pass_categories
+        )
+
+        assert [(e.text, e.start, e.end, e.score) for e in result] == [
+            ("", 0, 0, 0.0), ("John Doe", 0, 8, 0.92)
+        ]
+
     def test_should_extract_text_using_positions(self, detector_with_model):
         """Test text is extracted using start/end positions."""
         full_text = "Contact john@example.com for info"
@@ -383,6 +467,23 @@ class TestSinglePassDetection:
 
         assert result == []
 
+    def test_should_collect_parallel_passes_in_submission_order(self, detector_with_model):
+        """Test pass results keep category order even when a later pass finishes first."""
+        def predict(text, labels, threshold):
+            if "person name" in labels:
+                time.sleep(0.05)  # First category finishes last
+                return [{"label": "person name", "start": 0, "end": 8, "score": 0.9}]
+            return [{"label": "email address", "start": 12, "end": 28, "score": 0.9}]
+
+        detector_with_model._gliner_detector.model.predict_entities.side_effect = predict
+
+        entities = detector_with_model._run_parallel_passes(
+            "John Doe at john@example.com", 0.3, "test-006",
+            ["IDENTITY", "CONTACT"], detector_with_model._pass_categories
+        )
+
+        assert [e.pii_type for e in entities] == ["PERSON_NAME", "EMAIL"]
+
 
 class TestSpanAggregation:
     """Test cases for span aggregation."""
@@ -684,6 +785,13 @@ class TestDetectPII:
 
         assert result == []
 
+    def test_should_skip_passes_for_blank_text(self, fully_mocked_detector):
+        """Test empty or whitespace-only text returns without running any pass."""
+        assert fully_mocked_detector.detect_pii("") == []
+        assert fully_mocked_detector.mask_pii("  \n ") == ("  \n ", [])
+
+        fully_mocked_detector._gliner_detector.model.predict_entities.assert_not_called()
+
     def test_should_use_provided_threshold(self, fully_mocked_detector):
         """Test custom threshold is passed to detection."""
         fully_mocked_detector._gliner_detector.model.predict_entities.return_value = []
@@ -702,6 +810,20 @@ class TestDetectPII:
         # Should only call once (for IDENTITY)
         assert fully_mocked_detector._gliner_detector.model.predict_entities.call_count == 1
 
+    def test_should_skip_aggregation_when_single_category(self, fully_mocked_detector):
+        """Test a single pass goes straight to overlap removal."""
+        fully_mocked_detector._gliner_detector.model.predict_entities.return_value = [
+            {"label": "person name", "start": 0, "end": 8, "score": 0.92}
+        ]
+
+        with patch.object(fully_mocked_detector, '_aggregate_by_span') as mock_aggregate, \
+             patch.object(fully_mocked_detector, '_resolve_conflicts') as mock_resolve:
+            result = fully_mocked_detector.detect_pii("John Doe lives here", categories=["IDENTITY"])
+
+        mock_aggregate.assert_not_called()
+        mock_resolve.assert_not_called()
+        assert [(e.text, e.pii_type, e.score) for e in result] == [("John Doe", "PERSON_NAME", 0.92)]
+
     def test_Should_InitializeConflictResolver_When_PiiTypeConfigsProvided(
         self, detector_without_preloaded_categories
     ):
@@ -759,6 +881,40 @@ class TestDetectPII:
         assert "PERSON_NAME" in detector._pii_type_to_category
         assert "IP_ADDRESS" in detector._pii_type_to_category
 
+    def test_should_reuse_conflict_resolver_when_configs_unchanged(
+        self, detector_without_preloaded_categories
+    ):
+        """Test the resolver is only rebuilt when the type-to-category mapping changes."""
+        detector = detector_without_preloaded_categories
+        detector._gliner_detector.model.predict_entities.return_value = []
+        pii_type_configs = {
+            "PERSON_NAME": {"enabled": True, "category": "IDENTITY",
+                            "detector": "GLINER", "detector_label": "person name"},
+        }
+
+        detector.detect_pii("John Doe", pii_type_configs=pii_type_configs)
+        first_resolver = detector._conflict_resolver
+        detector.detect_pii("Jane Doe", pii_type_configs=dict(pii_type_configs))
+        assert detector._conflict_resolver is first_resolver
+
+        pii_type_configs["EMAIL"] = {"enabled": True, "category": "CONTACT",
+                                     "detector": "GLINER", "detector_label": "email"}
+        detector.detect_pii("jane@example.com", pii_type_configs=pii_type_configs)
+        assert detector._conflict_resolver is not first_resolver
+        assert "EMAIL" in detector._pii_type_to_category
+
+    def test_should_skip_summary_but_reset_stats_when_info_disabled(self, fully_mocked_detector):
+        """Test the detection summary is not built when INFO logging is off."""
+        resolver = fully_mocked_detector._conflict_resolver
+
+        with patch.object(fully_mocked_detector.logger, 'isEnabledFor', return_value=False), \
+             patch.object(fully_mocked_detector.logger, 'info') as mock_info:
+            fully_mocked_detector._log_detection_summary("det", 0.5, 100, 2, 3, 2, 2, 2)
+
+        mock_info.assert_not_called()
+        resolver.get_conflict_stats.assert_not_called()
+        resolver.reset_conflict_stats.assert_called_once()
+
 
 class TestModelManagement:
     """Test cases for model loading and management."""
@@ -848,4 +1004,19 @@ class TestMasking:
 
         assert "[EMAIL]" in masked_text
         assert "john@example.com" not in masked_text
-        assert len(entities) == 1
\ No newline at end of file
+        assert len(entities) == 1
+
+    def test_should_mask_mixed_entities_in_single_pass(self, detector_for_masking):
+        """Test _apply_masks handles dict/PIIEntity input, invalid and overlapping spans."""
+        text = "Call Jane Doe at 555-1234"
+        entities = [
+            {"start": 17, "end": 25, "type": "PHONE"},
+            PIIEntity(text="Jane Doe", pii_type="PERSONNAME", type_label="PERSONNAME",
+                      start=5, end=13, score=0.9),
+            {"start": 10, "end": 13, "type": "LASTNAME"},  # overlaps PERSONNAME
+            {"start": 20, "end": 99, "type": "INVALID"},  # out of bounds
+        ]
+
+        masked_text = detector_for_masking._apply_masks(text, entities)
+
+        assert masked_text == "Call [PERSONNAME] at [PHONE]"
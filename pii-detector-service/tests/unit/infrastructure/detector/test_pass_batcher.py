@@ -0,0 +1,153 @@
+"""
+Test suite for PassBatcher.
+
+Covers coalescing of concurrent same-pass calls into one batched GLiNER call,
+batch size limits, key separation and error propagation.
+"""
+
+import threading
+import time
+
+import pytest
+
+from pii_detector.infrastructure.detector.pass_batcher import PassBatcher
+
+
+class _BlockingPredictor:
+    """Fake batched predictor whose first call blocks until released."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = []
+        self.first_call_started = threading.Event()
+        self.release = threading.Event()
+        self.error = error
+
+    def __call__(self, texts, labels, threshold):
+        self.calls.append((list(texts), list(labels), threshold))
+        if len(self.calls) == 1:
+            self.first_call_started.set()
+            assert self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return [[{"label": labels[0], "text": text}] for text in texts]
+
+
+def _run_in_threads(batcher, texts, labels=("email",), threshold=0.5):
+    """Start one predict() call per text and return (threads, results, errors)."""
+    results = {}
+    errors = {}
+
+    def call(text):
+        try:
+            results[text] = batcher.predict(text, labels, threshold)
+        except Exception as e:
+            errors[text] = e
+
+    threads = [threading.Thread(target=call, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _wait_for_pending(batcher, key, count):
+    """Wait until ``count`` texts have joined the open batch for ``key``."""
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with batcher._cond:
+            batch = batcher._open.get(key)
+            if batch is not None and len(batch.texts) >= count:
+                return
+        time.sleep(0.001)
+    pytest.fail(f"{count} texts never joined the pending batch")
+
+
+class TestPassBatcher:
+    """Test cases for cross-request pass batching."""
+
+    def test_should_run_single_call_without_waiting(self):
+        """Test a lone caller is sent straight to GLiNER as a batch of one."""
+        predictor = _BlockingPredictor()
+        predictor.release.set()
+        batcher = PassBatcher(predictor, max_batch=8, max_wait_ms=0)
+
+        result = batcher.predict("a@b.ch", ["email"], 0.5)
+
+        assert result == [{"label": "email", "text": "a@b.ch"}]
+        assert predictor.calls == [(["a@b.ch"], ["email"], 0.5)]
+
+    def test_should_coalesce_callers_while_previous_batch_runs(self):
+        """Test callers arriving during a forward pass share the next one."""
+        predictor = _BlockingPredictor()
+        batcher = PassBatcher(predictor, max_batch=8, max_wait_ms=0)
+        key = (("email",), 0.5)
+
+        first_threads, results, errors = _run_in_threads(batcher, ["t0"])
+        assert predictor.first_call_started.wait(timeout=5)
+        threads, more_results, more_errors = _run_in_threads(batcher, ["t1", "t2", "t3"])
+        _wait_for_pending(batcher, key, 3)
+
+        predictor.release.set()
+        for thread in first_threads + threads:
+            thread.join(timeout=5)
+
+        assert not errors and not more_errors
+        assert len(predictor.calls) == 2
+        assert sorted(predictor.calls[1][0]) == ["t1", "t2", "t3"]
+        results.update(more_results)
+        assert {text: result[0]["text"] for text, result in results.items()} == {
+            "t0": "t0", "t1": "t1", "t2": "t2", "t3": "t3"
+        }
+
+    def test_should_split_batches_at_max_batch(self):
+        """Test no batched call holds more than max_batch texts."""
+        predictor = _BlockingPredictor()
+        batcher = PassBatcher(predictor, max_batch=2, max_wait_ms=0)
+
+        first_threads, _, _ = _run_in_threads(batcher, ["t0"])
+        assert predictor.first_call_started.wait(timeout=5)
+        threads, results, errors = _run_in_threads(batcher, ["t1", "t2", "t3"])
+        time.sleep(0.05)
+
+        predictor.release.set()
+        for thread in first_threads + threads:
+            thread.join(timeout=5)
+
+        assert not errors
+        assert len(results) == 3
+        assert all(len(texts) <= 2 for texts, _, _ in predictor.calls)
+        assert sorted(t for texts, _, _ in predictor.calls[1:] for t in texts) == ["t1", "t2", "t3"]
+
+    def test_should_not_mix_label_sets_in_one_batch(self):
+        """Test passes with different labels are never batched together."""
+        predictor = _BlockingPredictor()
+        predictor.release.set()
+        batcher = PassBatcher(predictor, max_batch=8, max_wait_ms=50)
+
+        threads_a, results_a, _ = _run_in_threads(batcher, ["a"], labels=("email",))
+        threads_b, results_b, _ = _run_in_threads(batcher, ["b"], labels=("phone number",))
+        for thread in threads_a + threads_b:
+            thread.join(timeout=5)
+
+        assert results_a["a"][0]["label"] == "email"
+        assert results_b["b"][0]["label"] == "phone number"
+        assert sorted(labels for _, labels, _ in predictor.calls) == [["email"], ["phone number"]]
+
+    def test_should_raise_in_every_caller_when_batch_fails(self):
+        """Test a failed batched call surfaces its error to all joined callers."""
+        predictor = _BlockingPredictor(error=RuntimeError("inference failed"))
+        batcher = PassBatcher(predictor, max_batch=8, max_wait_ms=0)
+        key = (("email",), 0.5)
+
+        first_threads, _, first_errors = _run_in_threads(batcher, ["t0"])
+        assert predictor.first_call_started.wait(timeout=5)
+        threads, _, errors = _run_in_threads(batcher, ["t1", "t2"])
+        _wait_for_pending(batcher, key, 2)
+
+        predictor.release.set()
+        for thread in first_threads + threads:
+            thread.join(timeout=5)
+
+        assert set(first_errors) == {"t0"}
+        assert set(errors) == {"t1", "t2"}
+        assert all(isinstance(e, RuntimeError) for e in errors.values())
+        assert not batcher._running
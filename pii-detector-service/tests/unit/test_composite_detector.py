@@ -50,6 +50,28 @@ class TestCompositePIIDetector:
         assert composite.regex_detector is mock_regex_detector
         assert composite.enable_regex is True
     
+    def test_Should_CloseMLDetector_When_CompositeClosed(
+        self, mock_ml_detector, mock_regex_detector
+    ):
+        """Should release the ML detector's resources on close."""
+        composite = CompositePIIDetector(
+            ml_detector=mock_ml_detector,
+            regex_detector=mock_regex_detector
+        )
+        
+        composite.close()
+        
+        mock_ml_detector.close.assert_called_once()
+    
+    def test_Should_NotFail_When_ClosingWithoutMLDetector(self, mock_regex_detector):
+        """Should close cleanly when running regex-only."""
+        composite = CompositePIIDetector(
+            ml_detector=None,
+            regex_detector=mock_regex_detector
+        )
+        
+        composite.close()
+    
     def test_Should_InitializeMLOnly_When_RegexDisabled(self, mock_ml_detector):
         """Should initialize with ML detector only when regex disabled."""
         composite = CompositePIIDetector(
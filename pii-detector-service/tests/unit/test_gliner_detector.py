@@ -56,6 +56,40 @@ class TestGLiNERDetectorInitialization:
         
         assert detector.model_id == "test-model-id"
 
+    @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
+    def test_should_parse_detection_settings_once(self, mock_manager_class):
+        """Test that all init-time settings come from a single config load."""
+        config = Mock(spec=DetectionConfig)
+        config.device = "cpu"
+        settings = {
+            "detection": {"log_throughput": False},
+            "parallel_processing": {"enabled": False, "max_workers": 3, "batch_size": 2, "chunk_cache_size": 16},
+        }
+
+        with patch('pii_detector.application.config.detection_policy._load_llm_config',
+                   return_value=settings) as mock_load:
+            detector = GLiNERDetector(config=config)
+
+        mock_load.assert_called_once()
+        assert detector.log_throughput is False
+        assert (detector.parallel_enabled, detector.max_workers) == (False, 3)
+        assert (detector.batch_size, detector.chunk_cache_size) == (2, 16)
+
+    @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
+    def test_should_use_defaults_when_settings_fail_to_load(self, mock_manager_class):
+        """Test that a settings load failure falls back to loader defaults."""
+        config = Mock(spec=DetectionConfig)
+        config.device = "cpu"
+
+        with patch('pii_detector.application.config.detection_policy._load_llm_config',
+                   side_effect=FileNotFoundError("missing")):
+            detector = GLiNERDetector(config=config)
+
+        assert detector.log_throughput is True
+        assert (detector.parallel_enabled, detector.max_workers) == (True, 10)
+        assert detector.batch_inference is True
+        assert (detector.batch_size, detector.chunk_cache_size) == (10, 0)
+
 
 class TestModelManagement:
     """Test cases for model loading and management."""
@@ -113,6 +147,7 @@ class TestModelManagement:
         
         mock_config.tokenizer = None
         mock_data_processor.config = mock_config
+        mock_data_processor.transformer_tokenizer = None
         mock_model.data_processor = mock_data_processor
         mock_model.config = Mock(model_name='bert-base-cased')
         
@@ -184,6 +219,20 @@ class TestPIIDetection:
         
         assert result == expected_entities
 
+    @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
+    def test_should_return_no_entities_for_blank_text(self, mock_manager_class):
+        """Test empty or whitespace-only text skips config loading and chunking."""
+        detector = GLiNERDetector()
+        detector.model = Mock()
+
+        with patch.object(detector, '_load_pii_type_configs_from_database') as mock_load_configs, \
+             patch.object(detector, '_detect_pii_with_chunking') as mock_chunking:
+            assert detector.detect_pii("") == []
+            assert detector.detect_pii(" \n\t ") == []
+
+        mock_load_configs.assert_not_called()
+        mock_chunking.assert_not_called()
+
 
 class TestPIIMasking:
     """Test cases for PII masking."""
@@ -243,10 +292,7 @@ class TestConfiguration:
         
         labels = detector._get_gliner_labels(mock_pii_type_mapping)
         
-        assert isinstance(labels, list)
-        assert len(labels) == 2
-        assert "email" in labels
-        assert "person name" in labels
+        assert labels == ("email", "person name")
     
     @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
     def test_should_convert_gliner_entities(self, mock_manager_class):
@@ -272,6 +318,40 @@ class TestConfiguration:
         assert result[0].text == "john@example.com"
         assert result[0].pii_type == "EMAIL"
     
+    @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
+    def test_should_build_mapping_and_thresholds_in_one_pass(self, mock_manager_class):
+        """Test that only enabled GLINER configs contribute labels and thresholds."""
+        config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
+        detector = GLiNERDetector(config=config)
+        
+        pii_type_configs = {
+            "EMAIL": {"enabled": True, "detector": "GLINER", "detector_label": "email", "threshold": 0.6},
+            "IBAN": {"enabled": True, "detector": "GLINER", "detector_label": None, "threshold": 0.7},
+            "PHONE": {"enabled": False, "detector": "GLINER", "detector_label": "phone", "threshold": 0.4},
+            "CREDIT_CARD": {"enabled": True, "detector": "PRESIDIO", "detector_label": "card", "threshold": 0.8},
+        }
+        
+        mapping, scoring = detector._build_settings_from_configs(pii_type_configs)
+        
+        assert mapping == {"email": "EMAIL"}
+        assert scoring == {"EMAIL": 0.6, "IBAN": 0.7}
+    
+    @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
+    def test_should_apply_chunk_offset_when_converting_entities(self, mock_manager_class):
+        """Test that the chunk offset shifts positions while text is extracted from the chunk."""
+        config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
+        detector = GLiNERDetector(config=config)
+        
+        chunk_text = "Mail john@example.com"
+        raw_entities = [
+            {"text": "john@example.com", "label": "email", "start": 5, "end": 21, "score": 0.95}
+        ]
+        
+        result = detector._convert_to_pii_entities(raw_entities, chunk_text, {"email": "EMAIL"}, 100)
+        
+        assert result[0].text == "john@example.com"
+        assert (result[0].start, result[0].end) == (105, 121)
+    
     @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
     def test_should_extract_pii_substring_from_chunk_text(self, mock_manager_class):
         """
@@ -427,6 +507,25 @@ class TestConfiguration:
         assert len(result) == 2
         assert result[0].text == ""
         assert result[1].text == ""
+
+    @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
+    def test_should_handle_missing_entity_keys_gracefully(self, mock_manager_class):
+        """Test a malformed GLiNER result without positions or score does not crash."""
+        config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
+        detector = GLiNERDetector(config=config)
+
+        raw_entities = [
+            {"label": "email"},
+            {"label": "email", "start": 8, "end": 24, "score": 0.95},
+        ]
+
+        result = detector._convert_to_pii_entities(
+            raw_entities, "Contact john@example.com", {"email": "EMAIL"}
+        )
+
+        assert [(e.text, e.start, e.end, e.score) for e in result] == [
+            ("", 0, 0, 0.0), ("john@example.com", 8, 24, 0.95)
+        ]
     
     @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
     def test_should_apply_masks_correctly(self, mock_manager_class):
@@ -484,7 +583,7 @@ class TestChunkingDetection:
         mock_chunker.chunk_text.return_value = chunk_results
         detector.semantic_chunker = mock_chunker
         
-        detector.model.predict_entities.side_effect = [
+        detector.model.batch_predict_entities.return_value = [
             [{"text": "john@example.com", "label": "email", "start": 8, "end": 24, "score": 0.95}],
             [{"text": "555-1234", "label": "phone number", "start": 5, "end": 13, "score": 0.90}]
         ]
@@ -505,8 +604,23 @@ class TestCleanup:
     """Test cases for cleanup and destruction."""
     
     @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
-    def test_should_cleanup_on_destruction(self, mock_manager_class):
-        """Test cleanup when detector is destroyed."""
+    def test_should_release_model_on_close(self, mock_manager_class):
+        """Test that close() drops the model, chunker and caches."""
         detector = GLiNERDetector()
         detector.model = Mock()
-        detector.__del__()
+        detector.semantic_chunker = Mock()
+        detector._chunk_cache[(b"key", ("email",), 0.5)] = []
+
+        detector.close()
+
+        assert detector.model is None
+        assert detector.semantic_chunker is None
+        assert len(detector._chunk_cache) == 0
+
+    @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
+    def test_should_close_when_leaving_context_manager(self, mock_manager_class):
+        """Test that the detector releases its model at the end of a with block."""
+        with GLiNERDetector() as detector:
+            detector.model = Mock()
+
+        assert detector.model is None
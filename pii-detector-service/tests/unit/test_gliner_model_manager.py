@@ -306,3 +306,325 @@ class TestIntegration:
         assert result1 is mock_model1
         assert result2 is mock_model2
         assert mock_gliner_class.from_pretrained.call_count == 2
+
+
+class TestInt8DynamicQuantization:
+    """Test cases for optional INT8 dynamic quantization."""
+
+    @patch('gliner.GLiNER')
+    def test_should_quantize_backbone_when_enabled_on_cpu(self, mock_gliner_class):
+        """Test that Linear layers are quantized when the flag is set and device is CPU."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+
+        mock_model = Mock()
+        backbone = mock_model.model
+        mock_gliner_class.from_pretrained.return_value = mock_model
+        torch_mock = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={"quantization": {"int8_dynamic": True}}), \
+             patch.dict('sys.modules', {'torch': torch_mock}):
+            result = manager.load_model()
+
+        torch_mock.quantization.quantize_dynamic.assert_called_once_with(
+            backbone, {torch_mock.nn.Linear}, dtype=torch_mock.qint8
+        )
+        assert result.model is torch_mock.quantization.quantize_dynamic.return_value
+
+    @patch('gliner.GLiNER')
+    def test_should_not_quantize_when_device_is_cuda(self, mock_gliner_class):
+        """Test that quantization is skipped for GPU devices."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cuda"
+        manager = GLiNERModelManager(config)
+        mock_gliner_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={"quantization": {"int8_dynamic": True}}), \
+             patch.object(manager, '_apply_int8_dynamic_quantization') as mock_quantize:
+            manager.load_model()
+
+        mock_quantize.assert_not_called()
+
+    def test_should_keep_float_model_when_quantization_fails(self):
+        """Test that a quantization error falls back to the original model."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        manager = GLiNERModelManager(config)
+
+        mock_model = Mock()
+        backbone = mock_model.model
+        torch_mock = Mock()
+        torch_mock.quantization.quantize_dynamic.side_effect = RuntimeError("no qengine")
+
+        with patch.dict('sys.modules', {'torch': torch_mock}):
+            result = manager._apply_int8_dynamic_quantization(mock_model)
+
+        assert result is mock_model
+        assert result.model is backbone
+
+    def test_should_read_settings_from_matching_model_config(self):
+        """Test that settings are read from the model TOML matching model_id."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "nvidia/gliner-PII"
+        manager = GLiNERModelManager(config)
+
+        llm_config = {"models": {
+            "other": {"model_id": "other/model", "quantization": {"int8_dynamic": False}},
+            "gliner-pii": {"model_id": "nvidia/gliner-PII", "quantization": {"int8_dynamic": True}},
+        }}
+
+        with patch('pii_detector.application.config.detection_policy._load_llm_config',
+                   return_value=llm_config):
+            assert manager._load_model_settings()["quantization"]["int8_dynamic"] is True
+
+
+class TestOnnxRuntimeLoading:
+    """Test cases for optional ONNX Runtime model loading."""
+
+    @patch('gliner.GLiNER')
+    def test_should_load_onnx_model_when_enabled(self, mock_gliner_class):
+        """Test that the ONNX model is loaded through GLiNER when enabled."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+        onnx_model = Mock()
+        mock_gliner_class.from_pretrained.return_value = onnx_model
+
+        settings = {"onnx": {"enabled": True, "model_file": "onnx/model.onnx"},
+                    "quantization": {"int8_dynamic": True}}
+        with patch.object(manager, '_load_model_settings', return_value=settings), \
+             patch.object(manager, '_apply_int8_dynamic_quantization') as mock_quantize:
+            result = manager.load_model()
+
+        assert result is onnx_model
+        mock_gliner_class.from_pretrained.assert_called_once_with(
+            "test-model",
+            load_onnx_model=True,
+            load_tokenizer=True,
+            onnx_model_file="onnx/model.onnx",
+            map_location="cpu"
+        )
+        mock_quantize.assert_not_called()
+
+    @patch('gliner.GLiNER')
+    def test_should_fall_back_to_pytorch_when_onnx_missing(self, mock_gliner_class):
+        """Test that a missing ONNX file falls back to the PyTorch model."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+        torch_model = Mock()
+        mock_gliner_class.from_pretrained.side_effect = [FileNotFoundError("model.onnx"), torch_model]
+
+        with patch.object(manager, '_load_model_settings', return_value={"onnx": {"enabled": True}}):
+            result = manager.load_model()
+
+        assert result is torch_model
+        assert mock_gliner_class.from_pretrained.call_args_list[1] == (("test-model",), {})
+
+
+class TestDevicePlacement:
+    """Test cases for placing the PyTorch model on the configured device."""
+
+    @patch('gliner.GLiNER')
+    def test_should_load_weights_on_gpu_when_device_is_cuda(self, mock_gliner_class):
+        """Test that CUDA deployments load the model with map_location set to the device."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cuda"
+        manager = GLiNERModelManager(config)
+        mock_gliner_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={}):
+            manager.load_model()
+
+        mock_gliner_class.from_pretrained.assert_called_once_with("test-model", map_location="cuda")
+
+    @patch('gliner.GLiNER')
+    def test_should_use_default_cpu_loading_when_device_is_cpu(self, mock_gliner_class):
+        """Test that CPU deployments keep GLiNER's default loading."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+        mock_gliner_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={}):
+            manager.load_model()
+
+        mock_gliner_class.from_pretrained.assert_called_once_with("test-model")
+
+
+class TestCpuThreadConfiguration:
+    """Test cases for torch CPU thread pinning."""
+
+    def test_should_set_torch_thread_counts_when_configured(self):
+        """Test that configured intra-op and inter-op thread counts are applied."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        manager = GLiNERModelManager(config)
+        torch_mock = Mock()
+
+        with patch.dict('sys.modules', {'torch': torch_mock}):
+            manager._configure_cpu_threads({"intra_op": 4, "inter_op": 1})
+
+        torch_mock.set_num_threads.assert_called_once_with(4)
+        torch_mock.set_num_interop_threads.assert_called_once_with(1)
+
+    def test_should_keep_torch_defaults_when_thread_counts_are_zero(self):
+        """Test that the default settings leave torch thread pools untouched."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        manager = GLiNERModelManager(config)
+        torch_mock = Mock()
+
+        with patch.dict('sys.modules', {'torch': torch_mock}):
+            manager._configure_cpu_threads({"intra_op": 0, "inter_op": 0})
+
+        torch_mock.set_num_threads.assert_not_called()
+        torch_mock.set_num_interop_threads.assert_not_called()
+
+    @patch('gliner.GLiNER')
+    def test_should_not_configure_threads_when_device_is_cuda(self, mock_gliner_class):
+        """Test that thread pinning is only applied to CPU deployments."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cuda"
+        manager = GLiNERModelManager(config)
+        mock_gliner_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={"threads": {"intra_op": 4}}), \
+             patch.object(manager, '_configure_cpu_threads') as mock_configure:
+            manager.load_model()
+
+        mock_configure.assert_not_called()
+
+
+class TestAutocastPrecision:
+    """Test cases for optional reduced-precision autocast inference."""
+
+    @patch('gliner.GLiNER')
+    def test_should_wrap_backbone_forward_when_dtype_is_bfloat16(self, mock_gliner_class):
+        """Test that the backbone forward runs under autocast with the configured dtype."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+
+        mock_model = Mock()
+        forward = mock_model.model.forward
+        mock_gliner_class.from_pretrained.return_value = mock_model
+        torch_mock = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={"precision": {"dtype": "bfloat16"}}), \
+             patch.dict('sys.modules', {'torch': torch_mock}):
+            result = manager.load_model()
+
+        torch_mock.autocast.assert_called_once_with(device_type="cpu", dtype=torch_mock.bfloat16)
+        torch_mock.autocast.return_value.assert_called_once_with(forward)
+        assert result.model.forward is torch_mock.autocast.return_value.return_value
+
+    @patch('gliner.GLiNER')
+    def test_should_not_autocast_when_dtype_is_float32(self, mock_gliner_class):
+        """Test that the default float32 precision leaves the model untouched."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+        mock_gliner_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={"precision": {"dtype": "float32"}}), \
+             patch.object(manager, '_apply_autocast') as mock_autocast:
+            manager.load_model()
+
+        mock_autocast.assert_not_called()
+
+    def test_should_keep_float32_forward_when_autocast_fails(self):
+        """Test that an autocast error leaves the original forward in place."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+
+        mock_model = Mock()
+        forward = mock_model.model.forward
+        torch_mock = Mock()
+        torch_mock.autocast.side_effect = RuntimeError("unsupported device")
+
+        with patch.dict('sys.modules', {'torch': torch_mock}):
+            result = manager._apply_autocast(mock_model, "bfloat16")
+
+        assert result.model.forward is forward
+
+
+class TestTorchCompile:
+    """Test cases for optional torch.compile of the GLiNER backbone."""
+
+    @patch('gliner.GLiNER')
+    def test_should_compile_backbone_and_warm_up_when_enabled(self, mock_gliner_class):
+        """Test that the backbone is compiled with dynamic shapes and warmed up at load."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+
+        mock_model = Mock()
+        backbone = mock_model.model
+        mock_gliner_class.from_pretrained.return_value = mock_model
+        torch_mock = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={"compile": {"enabled": True}}), \
+             patch.dict('sys.modules', {'torch': torch_mock}):
+            result = manager.load_model()
+
+        torch_mock.compile.assert_called_once_with(backbone, mode="reduce-overhead", dynamic=True)
+        assert result.model is torch_mock.compile.return_value
+        mock_model.predict_entities.assert_called_once()
+
+    def test_should_warm_up_each_configured_length(self):
+        """Test that one warmup prediction runs per configured word count."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        manager = GLiNERModelManager(config)
+        mock_model = Mock()
+
+        with patch.dict('sys.modules', {'torch': Mock()}):
+            manager._apply_torch_compile(mock_model, "reduce-overhead", [4, 16])
+
+        warmup_texts = [call.args[0] for call in mock_model.predict_entities.call_args_list]
+        assert [len(text.split()) for text in warmup_texts] == [4, 16]
+
+    @patch('gliner.GLiNER')
+    def test_should_not_compile_when_disabled(self, mock_gliner_class):
+        """Test that torch.compile is not applied by default."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        config.device = "cpu"
+        manager = GLiNERModelManager(config)
+        mock_gliner_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, '_load_model_settings', return_value={}), \
+             patch.object(manager, '_apply_torch_compile') as mock_compile:
+            manager.load_model()
+
+        mock_compile.assert_not_called()
+
+    def test_should_keep_eager_backbone_when_warmup_fails(self):
+        """Test that a compilation error during warmup restores the eager backbone."""
+        config = Mock(spec=DetectionConfig)
+        config.model_id = "test-model"
+        manager = GLiNERModelManager(config)
+
+        mock_model = Mock()
+        backbone = mock_model.model
+        mock_model.predict_entities.side_effect = RuntimeError("inductor backend failed")
+
+        with patch.dict('sys.modules', {'torch': Mock()}):
+            result = manager._apply_torch_compile(mock_model, "reduce-overhead", [32])
+
+        assert result is mock_model
+        assert result.model is backbone
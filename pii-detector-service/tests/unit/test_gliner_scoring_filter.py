@@ -1,17 +1,35 @@
 """
 Unit tests for GLiNER scoring filter functionality.
 
-This module tests the _apply_entity_scoring_filter method
-to ensure per-entity-type threshold filtering works correctly.
+This module tests the per-entity-type threshold filtering applied by
+_convert_to_pii_entities when scoring overrides are passed.
 """
 
 from unittest.mock import patch
 
 from pii_detector.application.config.detection_policy import DetectionConfig
-from pii_detector.domain.entity.pii_entity import PIIEntity
 from pii_detector.infrastructure.detector.gliner_detector import GLiNERDetector
 
 
+def _build_chunk(detections):
+    """
+    Build a chunk text and raw GLiNER entities from (text, pii_type, score) tuples.
+
+    Labels are the PII types themselves, so no label mapping is needed.
+    """
+    parts = []
+    raw_entities = []
+    position = 0
+    for text, pii_type, score in detections:
+        raw_entities.append({
+            "text": text, "label": pii_type,
+            "start": position, "end": position + len(text), "score": score,
+        })
+        parts.append(text)
+        position += len(text) + 1
+    return " ".join(parts), raw_entities
+
+
 class TestGLiNERScoringFilter:
     """Test cases for GLiNER scoring filter functionality."""
 
@@ -21,46 +39,42 @@ class TestGLiNERScoringFilter:
         # Arrange
         config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
         detector = GLiNERDetector(config=config)
-        
+
         # Scoring overrides passed as parameter (no longer instance variable)
         scoring_overrides = {
             'TELEPHONENUM': 0.95,
             'EMAIL': 0.80,
             'GIVENNAME': 0.75
         }
-        
+
         # Create entities with various scores
-        entities = [
+        chunk_text, raw_entities = _build_chunk([
             # Should be filtered (score < threshold)
-            PIIEntity(text="2010", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=0, end=4, score=0.85),
-            PIIEntity(text="john@test", pii_type="EMAIL", type_label="EMAIL", 
-                     start=10, end=19, score=0.75),
-            PIIEntity(text="Jean", pii_type="GIVENNAME", type_label="GIVENNAME", 
-                     start=25, end=29, score=0.70),
-            
+            ("2010", "TELEPHONENUM", 0.85),
+            ("john@test", "EMAIL", 0.75),
+            ("Jean", "GIVENNAME", 0.70),
+
             # Should pass (score >= threshold)
-            PIIEntity(text="+41 79 123 45 67", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=40, end=57, score=0.96),
-            PIIEntity(text="valid@email.com", pii_type="EMAIL", type_label="EMAIL", 
-                     start=60, end=75, score=0.92),
-            PIIEntity(text="Marie", pii_type="GIVENNAME", type_label="GIVENNAME", 
-                     start=80, end=85, score=0.88),
-        ]
-        
+            ("+41 79 123 45 67", "TELEPHONENUM", 0.96),
+            ("valid@email.com", "EMAIL", 0.92),
+            ("Marie", "GIVENNAME", 0.88),
+        ])
+
         # Act
-        filtered_entities = detector._apply_entity_scoring_filter(entities, scoring_overrides)
-        
+        filtered_entities = detector._convert_to_pii_entities(
+            raw_entities, chunk_text, {}, scoring_overrides=scoring_overrides
+        )
+
         # Assert
         assert len(filtered_entities) == 3, \
             f"Expected 3 entities after filtering, got {len(filtered_entities)}"
-        
+
         # Verify correct entities passed
         filtered_texts = {e.text for e in filtered_entities}
         assert "+41 79 123 45 67" in filtered_texts
         assert "valid@email.com" in filtered_texts
         assert "Marie" in filtered_texts
-        
+
         # Verify filtered entities are gone
         assert "2010" not in filtered_texts
         assert "john@test" not in filtered_texts
@@ -72,20 +86,20 @@ class TestGLiNERScoringFilter:
         # Arrange
         config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
         detector = GLiNERDetector(config=config)
-        
+
         # No scoring overrides (empty dict)
         scoring_overrides = {}
-        
-        entities = [
-            PIIEntity(text="test1", pii_type="EMAIL", type_label="EMAIL", 
-                     start=0, end=5, score=0.30),
-            PIIEntity(text="test2", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=10, end=15, score=0.40),
-        ]
-        
+
+        chunk_text, raw_entities = _build_chunk([
+            ("test1", "EMAIL", 0.30),
+            ("test2", "TELEPHONENUM", 0.40),
+        ])
+
         # Act
-        filtered_entities = detector._apply_entity_scoring_filter(entities, scoring_overrides)
-        
+        filtered_entities = detector._convert_to_pii_entities(
+            raw_entities, chunk_text, {}, scoring_overrides=scoring_overrides
+        )
+
         # Assert
         assert len(filtered_entities) == 2, \
             "All entities should be kept when no scoring overrides are configured"
@@ -96,33 +110,32 @@ class TestGLiNERScoringFilter:
         # Arrange
         config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
         detector = GLiNERDetector(config=config)
-        
+
         # Only TELEPHONENUM has a scoring override
         scoring_overrides = {
             'TELEPHONENUM': 0.95
         }
-        
-        entities = [
+
+        chunk_text, raw_entities = _build_chunk([
             # Should be filtered (has threshold and score below)
-            PIIEntity(text="2010", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=0, end=4, score=0.85),
-            
+            ("2010", "TELEPHONENUM", 0.85),
+
             # Should pass (no threshold configured for EMAIL)
-            PIIEntity(text="test@email.com", pii_type="EMAIL", type_label="EMAIL", 
-                     start=10, end=24, score=0.40),
-            
+            ("test@email.com", "EMAIL", 0.40),
+
             # Should pass (no threshold configured for GIVENNAME)
-            PIIEntity(text="Jean", pii_type="GIVENNAME", type_label="GIVENNAME", 
-                     start=30, end=34, score=0.50),
-        ]
-        
+            ("Jean", "GIVENNAME", 0.50),
+        ])
+
         # Act
-        filtered_entities = detector._apply_entity_scoring_filter(entities, scoring_overrides)
-        
+        filtered_entities = detector._convert_to_pii_entities(
+            raw_entities, chunk_text, {}, scoring_overrides=scoring_overrides
+        )
+
         # Assert
         assert len(filtered_entities) == 2, \
             f"Expected 2 entities (EMAIL and GIVENNAME), got {len(filtered_entities)}"
-        
+
         filtered_types = {e.pii_type for e in filtered_entities}
         assert "EMAIL" in filtered_types
         assert "GIVENNAME" in filtered_types
@@ -134,34 +147,31 @@ class TestGLiNERScoringFilter:
         # Arrange
         config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
         detector = GLiNERDetector(config=config)
-        
+
         scoring_overrides = {
             'TELEPHONENUM': 0.95
         }
-        
-        entities = [
+
+        chunk_text, raw_entities = _build_chunk([
             # False positives (should be filtered)
-            PIIEntity(text="2010", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=0, end=4, score=0.85),
-            PIIEntity(text="8 1700", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=10, end=16, score=0.85),
-            PIIEntity(text="692.20", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=20, end=26, score=0.85),
-            
+            ("2010", "TELEPHONENUM", 0.85),
+            ("8 1700", "TELEPHONENUM", 0.85),
+            ("692.20", "TELEPHONENUM", 0.85),
+
             # Valid phone numbers (should pass)
-            PIIEntity(text="+41 79 123 45 67", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=30, end=47, score=0.96),
-            PIIEntity(text="022 123 45 67", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=50, end=63, score=0.97),
-        ]
-        
+            ("+41 79 123 45 67", "TELEPHONENUM", 0.96),
+            ("022 123 45 67", "TELEPHONENUM", 0.97),
+        ])
+
         # Act
-        filtered_entities = detector._apply_entity_scoring_filter(entities, scoring_overrides)
-        
+        filtered_entities = detector._convert_to_pii_entities(
+            raw_entities, chunk_text, {}, scoring_overrides=scoring_overrides
+        )
+
         # Assert
         assert len(filtered_entities) == 2, \
             f"Expected 2 valid phone numbers, got {len(filtered_entities)}"
-        
+
         for entity in filtered_entities:
             assert entity.score >= 0.95, \
                 f"Entity '{entity.text}' has score {entity.score} < 0.95"
@@ -172,24 +182,46 @@ class TestGLiNERScoringFilter:
         # Arrange
         config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
         detector = GLiNERDetector(config=config)
-        
+
         scoring_overrides = {
             'TELEPHONENUM': 0.95
         }
-        
-        entities = [
+
+        chunk_text, raw_entities = _build_chunk([
             # Score exactly equals threshold (should pass)
-            PIIEntity(text="+41 79 123 45 67", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=0, end=17, score=0.95),
+            ("+41 79 123 45 67", "TELEPHONENUM", 0.95),
             # Score below threshold (should be filtered)
-            PIIEntity(text="2010", pii_type="TELEPHONENUM", type_label="TELEPHONENUM", 
-                     start=20, end=24, score=0.9499),
-        ]
-        
+            ("2010", "TELEPHONENUM", 0.9499),
+        ])
+
         # Act
-        filtered_entities = detector._apply_entity_scoring_filter(entities, scoring_overrides)
-        
+        filtered_entities = detector._convert_to_pii_entities(
+            raw_entities, chunk_text, {}, scoring_overrides=scoring_overrides
+        )
+
         # Assert
         assert len(filtered_entities) == 1
         assert filtered_entities[0].text == "+41 79 123 45 67"
         assert filtered_entities[0].score == 0.95
+
+    @patch('pii_detector.infrastructure.detector.gliner_detector.GLiNERModelManager')
+    def test_should_filter_below_threshold_during_conversion(self, mock_manager_class):
+        """Test that scoring overrides drop raw entities before PIIEntity construction."""
+        # Arrange
+        config = DetectionConfig(model_id="gliner-pii", device="cpu", threshold=0.5)
+        detector = GLiNERDetector(config=config)
+
+        chunk_text = "Jean 2010 Marie"
+        raw_entities = [
+            {"text": "Jean", "label": "first name", "start": 0, "end": 4, "score": 0.70},
+            {"text": "2010", "label": "phone number", "start": 5, "end": 9, "score": 0.85},
+            {"text": "Marie", "label": "first name", "start": 10, "end": 15, "score": 0.88},
+        ]
+        mapping = {"first name": "GIVENNAME", "phone number": "TELEPHONENUM"}
+        scoring_overrides = {"GIVENNAME": 0.75}
+
+        # Act
+        entities = detector._convert_to_pii_entities(raw_entities, chunk_text, mapping, 20, scoring_overrides)
+
+        # Assert - Jean filtered, phone has no override and is kept
+        assert [(e.text, e.start) for e in entities] == [("2010", 25), ("Marie", 30)]
@@ -243,6 +243,21 @@ class TestLifecycleOperations:
         # Should not raise, should continue to model2
         mock_det2.load_model.assert_called_once()
 
+    def test_should_close_all_detectors_and_continue_on_failure(self, mock_logger):
+        """Test close() reaches every detector even when one fails to close."""
+        mock_det1 = Mock()
+        mock_det1.close.side_effect = Exception("Close error")
+        mock_det2 = Mock()
+        mock_det3 = Mock(spec=["model_id", "download_model", "load_model", "detect_pii"])
+        mock_factory = Mock()
+        mock_factory.create.side_effect = [mock_det1, mock_det2, mock_det3]
+
+        detector = MultiModelPIIDetector(model_ids=["model1", "model2", "model3"], factory=mock_factory)
+        detector.close()
+
+        mock_det1.close.assert_called_once()
+        mock_det2.close.assert_called_once()
+
 
 class TestPIIDetection:
     """Test cases for PII detection."""
@@ -355,6 +370,23 @@ class TestPIIMasking:
         assert masked_text == "Contact [EMAIL]"
         assert len(entities) == 1
 
+    def test_should_skip_entity_overlapping_masked_span(self, mock_logger):
+        """Test an entity overlapping an already masked span is not masked again."""
+        entities = [
+            PIIEntity(text="555-1234", pii_type="PHONE", type_label="PHONE", start=17, end=25, score=0.9),
+            PIIEntity(text="Jane Doe", pii_type="PERSON", type_label="PERSON", start=5, end=13, score=0.9),
+            PIIEntity(text="Doe", pii_type="LASTNAME", type_label="LASTNAME", start=10, end=13, score=0.9),
+        ]
+        mock_factory = Mock()
+        mock_factory.create.return_value = Mock(model_id="model1")
+        
+        detector = MultiModelPIIDetector(model_ids=["model1"], factory=mock_factory)
+        with patch.object(detector, 'detect_pii', return_value=entities):
+            masked_text, result = detector.mask_pii("Call Jane Doe at 555-1234")
+        
+        assert masked_text == "Call [PERSON] at [PHONE]"
+        assert result == entities
+
 
 class TestOverlapResolution:
     """Test cases for overlap resolution.
@@ -363,6 +363,19 @@ class TestPIIMasking:
         assert "[B]" in masked_text
         assert "[A]" in masked_text
 
+    def test_should_skip_entity_overlapping_masked_span(self, detector_with_mocks):
+        """Should keep the earliest entity and skip one overlapping it."""
+        text = "Call Jane Doe at 555-1234"
+        entities = [
+            PIIEntity("555-1234", "PHONE", "PHONE", 17, 25, 0.9),
+            PIIEntity("Jane Doe", "PERSON", "PERSON", 5, 13, 0.9),
+            PIIEntity("Doe", "LASTNAME", "LASTNAME", 10, 13, 0.9),
+        ]
+
+        masked_text = detector_with_mocks._apply_masks(text, entities)
+
+        assert masked_text == "Call [PERSON] at [PHONE]"
+
 
 # ============================================================================
 # Summary Tests
@@ -437,6 +437,35 @@ class TestMemoryLimitedServer:
         assert server.server is mock_server_instance
 
 
+class TestDetectorShutdown:
+    """Test cases for releasing the singleton detector on shutdown."""
+    
+    @patch('pii_detector.infrastructure.adapter.in.grpc.pii_service._shutdown_pii_log_listener')
+    def test_stop_closes_detector_instance(self, mock_shutdown_listener):
+        """Test that stop() closes the singleton detector after the gRPC server."""
+        mock_detector = Mock()
+        server = MemoryLimitedServer()
+        server.server = Mock()
+        
+        with patch.object(pii_service, '_detector_instance', mock_detector):
+            server.stop(grace=1)
+            
+            assert pii_service._detector_instance is None
+        
+        server.server.stop.assert_called_once_with(1)
+        mock_detector.close.assert_called_once()
+    
+    def test_shutdown_detector_instance_is_idempotent(self):
+        """Test that repeated shutdowns close the detector only once."""
+        mock_detector = Mock()
+        
+        with patch.object(pii_service, '_detector_instance', mock_detector):
+            pii_service._shutdown_detector_instance()
+            pii_service._shutdown_detector_instance()
+        
+        mock_detector.close.assert_called_once()
+
+
 class TestServeFunction:
     """Test cases for the serve() function."""
     
@@ -185,6 +185,19 @@ class TestRegexDetector:
         assert "00:1B:44:11:3A:B7" not in masked_text
         assert len(entities) >= 1
     
+    def test_Should_SkipOverlappingEntity_When_Masking(self, detector):
+        """Should mask the earliest span and skip an entity overlapping it."""
+        text = "Call Jane Doe at 555-1234"
+        entities = [
+            PIIEntity("555-1234", "PHONE", "PHONE", 17, 25, 0.9),
+            PIIEntity("Jane Doe", "PERSON", "PERSON", 5, 13, 0.9),
+            PIIEntity("Doe", "LASTNAME", "LASTNAME", 10, 13, 0.9),
+        ]
+        
+        masked_text = detector._apply_masks(text, entities)
+        
+        assert masked_text == "Call [PERSON] at [PHONE]"
+    
     def test_Should_NoOpDownload_When_CalledSafely(self, detector):
         """Should safely no-op on download_model."""
         # Should not raise exception